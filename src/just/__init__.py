@@ -1,28 +1,57 @@
-from typing_extensions import Annotated
-from typer import Option, Argument
-
-from just.cli import just_cli, capture_exception
-from just.core.config import (
-    JustConfig,
-    load_env_config,
-    update_env_config,
-    get_cache_dir,
-)
-from just.core.installer import installer, ArchiveInstaller, BashScriptInstaller, BinaryInstaller
-from just.utils import (
-    SystemProbe,
-    create_typer_app,
-    confirm_action,
-    docstring,
-    download_with_resume,
-    echo,
-    extract,
-    execute_commands,
-)
-
-
-config = JustConfig()
-system = SystemProbe()
+import importlib
+
+from typing import Annotated
+
+
+# Public names are resolved on first access so that `import just` (and every
+# command module doing `from just import just_cli`) doesn't pay for the whole
+# installer/download/archive import graph up front.
+_LAZY = {
+    "just_cli": ("just.cli", "just_cli"),
+    "capture_exception": ("just.cli", "capture_exception"),
+    "Argument": ("typer", "Argument"),
+    "Option": ("typer", "Option"),
+    "JustConfig": ("just.core.config", "JustConfig"),
+    "load_env_config": ("just.core.config", "load_env_config"),
+    "update_env_config": ("just.core.config", "update_env_config"),
+    "get_cache_dir": ("just.core.config", "get_cache_dir"),
+    "installer": ("just.core.installer", "installer"),
+    "ArchiveInstaller": ("just.core.installer", "ArchiveInstaller"),
+    "BashScriptInstaller": ("just.core.installer", "BashScriptInstaller"),
+    "BinaryInstaller": ("just.core.installer", "BinaryInstaller"),
+    "SystemProbe": ("just.utils", "SystemProbe"),
+    "create_typer_app": ("just.utils", "create_typer_app"),
+    "confirm_action": ("just.utils", "confirm_action"),
+    "docstring": ("just.utils", "docstring"),
+    "download_with_resume": ("just.utils", "download_with_resume"),
+    "echo": ("just.utils", "echo"),
+    "extract": ("just.utils", "extract"),
+    "execute_commands": ("just.utils", "execute_commands"),
+}
+
+# Module-level singletons, constructed from the given class on first access.
+_LAZY_INSTANCES = {
+    "config": ("just.core.config", "JustConfig"),
+    "system": ("just.utils", "SystemProbe"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_INSTANCES:
+        module_name, attr = _LAZY_INSTANCES[name]
+        value = getattr(importlib.import_module(module_name), attr)()
+    elif name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY) + list(_LAZY_INSTANCES)
+
 
 __all__ = [
     "Annotated",
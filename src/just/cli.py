@@ -1,21 +1,92 @@
-import functools
-import importlib
+import json
 import os
+import sys
 import traceback
 
 from pathlib import Path
-from typer.core import TyperGroup
-from typing import Any, Callable, List, TypeVar, Optional
+from typer.core import TyperCommand
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar, Optional
 
-from just.core.config import load_env_config, get_command_dir, get_extension_dir, ensure_extensions_dir_exists
+from just.core.config import (
+    load_env_config,
+    get_cache_dir,
+    get_command_dir,
+    ensure_extensions_dir_exists,
+)
 from just.utils import echo
-from just.utils.typer_utils import create_typer_app, get_just_version
+from just.utils.file_utils import mtimes_are_current
+from just.utils.typer_utils import NormalizedGroup, create_typer_app, get_just_version, normalize_command_name
 
 import typer
 from typing import Annotated
 
 
-just_cli = create_typer_app()
+# Top-level command name -> {"modules", "help", "short_help"}, filled from the
+# module cache so that only the module of the invoked command gets imported.
+lazy_commands: Dict[str, Dict[str, Any]] = {}
+
+# Top-level command names in registration order, as recorded in the module
+# cache, so the help page lists them as if every module had been imported
+command_order: List[str] = []
+
+
+class LazyGroup(NormalizedGroup):
+    """
+    A NormalizedGroup that imports the module of a top-level command on first use.
+
+    While the help page is rendered, commands that aren't imported yet are
+    listed from their cached help text instead of being imported.
+    """
+
+    _listing = False
+
+    def list_commands(self, ctx):
+        loaded = super().list_commands(ctx)
+        names = [name for name in command_order if name in lazy_commands or name in self.commands]
+        listed = set(names)
+        return names + [name for name in loaded if name not in listed]
+
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx, incomplete):
+        # Completing subcommand names only needs their names and help text
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+    def get_command(self, ctx, cmd_name: str):
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None:
+            return cmd
+
+        name = cmd_name if cmd_name in lazy_commands else normalize_command_name(cmd_name)
+        if name not in lazy_commands:
+            if not self._listing and lazy_commands:
+                # Unknown name: load everything so typo suggestions see all commands
+                self._load(list(lazy_commands))
+            return super().get_command(ctx, cmd_name)
+
+        if self._listing:
+            entry = lazy_commands[name]
+            return TyperCommand(name, help=entry["help"], short_help=entry["short_help"])
+
+        self._load([name])
+        return super().get_command(ctx, name)
+
+    def _load(self, names: List[str]) -> None:
+        for name in names:
+            import_script_modules(lazy_commands.pop(name)["modules"])
+        self.commands.update(typer.main.get_group(just_cli).commands)
+
+
+just_cli = create_typer_app(cls=LazyGroup)
 
 T = TypeVar('T')
 
@@ -42,7 +113,6 @@ def _main_callback(
 
 
 def capture_exception(func: Callable[..., T]) -> Callable[..., Optional[T]]:
-    @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Optional[T]:
         try:
             return func(*args, **kwargs)
@@ -50,78 +120,331 @@ def capture_exception(func: Callable[..., T]) -> Callable[..., Optional[T]]:
             echo.error(str(e))
             exit(1)
 
+    # Only what typer reads is carried over: the name and help text, the
+    # annotations for get_type_hints(), and __wrapped__ so inspect.signature()
+    # resolves the original parameters. functools.wraps would also copy
+    # __dict__ and friends for every decorated command at import time.
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__module__ = func.__module__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__annotations__ = func.__annotations__
+    wrapper.__wrapped__ = func
     return wrapper
 
 
-class SortedGroup(TyperGroup):
-    def list_commands(self, ctx):
-        return sorted(super().list_commands(ctx))
-
-
 def run_just_cli(*args, **kwargs):
     load_env_config()
     just_cli(*args, **kwargs)
 
 
-def traverse_script_dir(directory: str, base_path: Path) -> List[str]:
-    script_modules = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if not file.startswith('_') and file.endswith(".py"):
-                script_modules.append(
-                    "just." +
-                    '.'.join(Path(root).relative_to(base_path).parts) +
-                    f".{str(Path(file).stem)}"
-                )
-    return script_modules
+# Root of the `just` package, which `just.commands.*` module names are relative to.
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _iter_py_modules(
+    root: str,
+    offset: int,
+    prefix: str,
+    stamps: Optional[Dict[str, int]] = None
+) -> Iterator[str]:
+    # DirEntry carries the d_type from the directory listing, so neither the
+    # is_dir() check nor the name filters below cost an extra stat() call.
+    # Private and hidden entries (__pycache__, .git, .venv, ...) are pruned
+    # before recursing so their contents are never listed.
+    # If `stamps` is given, the mtime of every walked directory and module
+    # file is recorded in it for validating the module cache.
+    if stamps is not None:
+        stamps[root] = os.stat(root).st_mtime_ns
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.name.startswith('_') or entry.name.startswith('.'):
+                # Packages are imported as parents of their modules, so their
+                # __init__ counts as a module file for the cache
+                if stamps is not None and entry.name == "__init__.py":
+                    stamps[entry.path] = entry.stat().st_mtime_ns
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                # Never descend into vendored JS trees, they hold no commands.
+                if entry.name == "node_modules":
+                    continue
+                yield from _iter_py_modules(entry.path, offset, prefix, stamps)
+            elif entry.name.endswith(".py"):
+                if stamps is not None:
+                    stamps[entry.path] = entry.stat().st_mtime_ns
+                # Interned, so the sys.modules lookups during import compare by identity
+                yield sys.intern(prefix + entry.path[offset:-3].replace(os.sep, '.'))
+
+
+def traverse_script_dir(
+    directory: str,
+    base_path: str,
+    prefix: str = "just.",
+    stamps: Optional[Dict[str, int]] = None
+) -> List[str]:
+    offset = len(os.path.normpath(base_path)) + 1
+    return list(_iter_py_modules(os.path.normpath(directory), offset, prefix, stamps))
+
+
+_MODULE_CACHE_VERSION = 4
+
+
+def _get_module_cache_file() -> Path:
+    return get_cache_dir() / "commands.json"
+
+
+def _module_cache_key(commands_dir: Path, extensions_dir: Path) -> List[Any]:
+    # Only the roots are checked here. Files added inside a nested package
+    # don't touch them, so the cache also records the mtime of every walked
+    # directory and module file, checked in load_module_cache().
+    return [
+        _MODULE_CACHE_VERSION,
+        str(commands_dir),
+        os.stat(commands_dir).st_mtime_ns,
+        os.stat(extensions_dir).st_mtime_ns,
+        list(sys.version_info[:2]),
+    ]
+
+
+def load_module_cache(key: List[Any]) -> Optional[Dict[str, Any]]:
+    """Return the cached command registry if it was recorded under `key`."""
+    try:
+        with open(_get_module_cache_file(), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    if not mtimes_are_current(cached.get("stamps")):
+        return None
+    return cached
+
+
+def save_module_cache(key: List[Any], content: Dict[str, Any]) -> None:
+    cache_file = _get_module_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"key": key, **content}, f)
+    except OSError:
+        # The cache is an optimization only; a read-only home must not break the CLI
+        pass
+
+
+def _registered_names(typer_app: typer.Typer, commands_start: int, groups_start: int) -> List[str]:
+    """Get the top-level names registered on `typer_app` past the given list offsets."""
+    names = []
+    for info in typer_app.registered_commands[commands_start:]:
+        names.append(info.name or typer.main.get_command_name(info.callback.__name__))
+    for info in typer_app.registered_groups[groups_start:]:
+        name = info.name or info.typer_instance.info.name
+        if name:
+            names.append(name)
+        else:
+            # Typer merges the commands of an unnamed sub-app into the parent
+            names.extend(_registered_names(info.typer_instance, 0, 0))
+    return names
+
+
+def _report_import_errors(import_errors: List[Tuple[str, ImportError]]) -> None:
+    """Warn once per missing package, with full tracebacks if JUST_DEBUG_IMPORTS=1."""
+    if os.environ.get("JUST_DEBUG_IMPORTS") == "1":
+        for module_name, e in import_errors:
+            sys.stderr.write(f"Failed to import {module_name}:\n")
+            sys.stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+
+    for package_name in dict.fromkeys(e.name for _, e in import_errors):
+        echo.warning(
+            f"`{package_name}` is not installed, some sub commands are disabled, "
+            f"refer to README.md for instructions."
+        )
 
 
-def load_extensions_dynamically():
-    extensions_dir = get_extension_dir()
-    if not extensions_dir.exists():
+def _count_registered(typer_app: typer.Typer) -> int:
+    """Count the commands and groups registered on `typer_app` and its sub-apps."""
+    return len(typer_app.registered_commands) + sum(
+        1 + _count_registered(info.typer_instance) for info in typer_app.registered_groups
+    )
+
+
+def _with_parent_packages(module_names: List[str], packages: Dict[str, str]) -> List[str]:
+    # Parent packages not imported yet go first, so what their __init__
+    # registers is credited to them and not to the first module inside.
+    # Parents of a nested module belong to the same top-level command.
+    ordered = {}
+    for module_name in module_names:
+        parts = module_name.split('.')
+        for i in range(1, len(parts)):
+            parent = '.'.join(parts[:i])
+            if parent not in sys.modules:
+                ordered[parent] = None
+                if module_name in packages:
+                    packages.setdefault(parent, packages[module_name])
+        ordered[module_name] = None
+    return [*ordered]
+
+
+def import_script_modules(
+    module_names: List[str],
+    packages: Optional[Dict[str, str]] = None
+) -> Dict[str, List[str]]:
+    """
+    Import modules so that they register their commands on `just_cli`.
+
+    Args:
+        module_names: Dotted names of the modules to import
+        packages: Module name to its top-level command for modules nested in a
+            command package, credited to that command if they extend its sub-app
+
+    Returns:
+        Dictionary mapping each imported module (and parent package) to the
+        top-level command names it registered, failed modules are left out
+    """
+    packages = dict(packages or {})
+    registered = {}
+    import_errors = []
+    for module_name in _with_parent_packages(module_names, packages):
+        if module_name in sys.modules:
+            # Already imported by a sibling module, its commands were credited there
+            registered[module_name] = []
+            continue
+        commands_start = len(just_cli.registered_commands)
+        groups_start = len(just_cli.registered_groups)
+        nested = module_name in packages
+        registered_before = _count_registered(just_cli) if nested else 0
+        try:
+            # The names are absolute, so the name checks of import_module() are skipped
+            __import__(module_name)
+        except ImportError as e:
+            import_errors.append((module_name, e))
+            continue
+        except Exception as e:
+            echo.warning(f"Failed to load {module_name}: {e}")
+            continue
+        names = _registered_names(just_cli, commands_start, groups_start)
+        if nested and not names and _count_registered(just_cli) > registered_before:
+            names = [packages[module_name]]
+        registered[module_name] = names
+
+    if import_errors:
+        _report_import_errors(import_errors)
+    return registered
+
+
+def build_command_registry(module_names: List[str], packages: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Import every module and record which top-level command each one belongs to.
+
+    Args:
+        module_names: Dotted names of the modules to import
+        packages: Module name to its top-level package for modules nested
+            in a command package (they may extend that command's sub-app)
+
+    Returns:
+        Dictionary with the command registry and the modules that failed to import
+    """
+    registered = import_script_modules(module_names, packages)
+
+    # Modules that registered nothing (e.g. `ext` subcommands, which the ext
+    # package imports on demand) are left out, loading a command skips them
+    commands: Dict[str, List[str]] = {}
+    for module_name, names in registered.items():
+        for name in dict.fromkeys(names):
+            commands.setdefault(name, []).append(module_name)
+
+    # Recorded in the group's own order (commands, then sub-apps), which is
+    # how the help page lists them once everything is imported
+    group = typer.main.get_group(just_cli)
+    registry = {}
+    for name, cmd in group.commands.items():
+        if name in commands:
+            registry[name] = {"modules": commands[name], "help": cmd.help, "short_help": cmd.short_help}
+
+    return {
+        "registry": registry,
+        "eager": [module_name for module_name in module_names if module_name not in registered],
+    }
+
+
+# Below this many extension modules a thread pool costs more than it saves
+_PREFETCH_THRESHOLD = 8
+
+
+def _read_module_files(path: str) -> None:
+    import importlib.util
+
+    for file_path in (path, importlib.util.cache_from_source(path)):
+        try:
+            with open(file_path, "rb") as f:
+                f.read()
+        except OSError:
+            pass
+
+
+def prefetch_module_files(paths: List[str]) -> None:
+    """
+    Read module sources and their cached bytecode in parallel ahead of importing.
+
+    The imports themselves stay sequential since every module has to register
+    its commands in order, but on a cold filesystem cache the reads overlap.
+    """
+    if len(paths) <= _PREFETCH_THRESHOLD:
         return
 
-    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_read_module_files, paths))
+
+
+def _top_level_packages(module_names: List[str], depth: int) -> Dict[str, str]:
+    # e.g. just.commands.ext.add -> ext for depth 2
+    return {
+        module_name: module_name.split('.')[depth]
+        for module_name in module_names
+        if module_name.count('.') > depth
+    }
+
+
+def load_script_modules(commands_dir: Path, extensions_dir: Path) -> None:
+    """
+    Make all command and extension modules available to `just_cli`.
+
+    With a valid module cache only the modules that failed to import last
+    time are imported here, all others are registered as lazy commands.
+    """
     if str(extensions_dir.parent) not in sys.path:
         sys.path.insert(0, str(extensions_dir.parent))
 
-    for root, dirs, files in os.walk(extensions_dir):
-        for file in files:
-            if not file.startswith('_') and file.endswith(".py"):
-                try:
-                    rel_path = Path(root).relative_to(extensions_dir.parent)
-                    module_name = '.'.join(rel_path.parts) + f".{Path(file).stem}"
-                    importlib.import_module(module_name)
-                except Exception as e:
-                    echo.warning(f"Failed to load extension {file}: {e}")
+    key = _module_cache_key(commands_dir, extensions_dir)
+    cached = load_module_cache(key)
+    if cached is not None:
+        lazy_commands.update(cached["registry"])
+        command_order[:] = cached["registry"]
+        import_script_modules(cached["eager"])
+        return
+
+    stamps: Dict[str, int] = {}
+    commands = traverse_script_dir(str(commands_dir), PACKAGE_DIR, stamps=stamps)
+    # scandir order is arbitrary; sorting keeps the registration order (and
+    # with it which module wins a duplicate command name) stable
+    commands.sort()
+    extensions = traverse_script_dir(str(extensions_dir), str(extensions_dir.parent), prefix="", stamps=stamps)
+    prefetch_module_files([
+        os.path.join(str(extensions_dir.parent), *module_name.split('.')) + ".py"
+        for module_name in extensions
+    ])
+    packages = {**_top_level_packages(commands, 2), **_top_level_packages(extensions, 1)}
+    registry = build_command_registry(commands + extensions, packages)
+    save_module_cache(key, {**registry, "stamps": stamps})
 
 
 def main():
     # Ensure extensions directory exists
-    ensure_extensions_dir_exists()
-
-    # Dynamically import all script modules to register their commands
-    script_modules = []
-    commands_dir = get_command_dir()
-    script_modules.extend(traverse_script_dir(commands_dir.as_posix(), Path(__file__).parent))
-    script_modules.sort()
-    missing_packages = []
-    for module_name in script_modules:
-        try:
-            importlib.import_module(module_name)
-        except ImportError as e:
-            traceback.print_exc()
-            package_name = e.name
-            if package_name not in missing_packages:
-                missing_packages.append(package_name)
-                echo.warning(
-                    f"`{package_name}` is not installed, some sub commands are disabled, "
-                    f"refer to README.md for instructions."
-                )
-            continue
+    extensions_dir = ensure_extensions_dir_exists()
 
-    # Load extensions from ~/.just/extensions
-    load_extensions_dynamically()
+    # Register the commands from the package and from ~/.just/extensions
+    load_script_modules(get_command_dir(), extensions_dir)
 
     # Run the CLI application
     run_just_cli()
@@ -1,6 +1,5 @@
 import typer
-from typing import List, Optional, Dict
-from typing_extensions import Annotated
+from typing import Annotated, Dict, List, Optional
 
 from just import just_cli, capture_exception, echo
 from just.utils import download_with_resume
@@ -13,8 +12,8 @@ def parse_headers(header_list: Optional[List[str]]) -> Optional[Dict[str, str]]:
         return None
     headers: Dict[str, str] = {}
     for header in header_list:
-        if ':' in header:
-            key, value = header.split(':', 1)
+        key, sep, value = header.partition(':')
+        if sep:
             headers[key.strip()] = value.strip()
     return headers
 
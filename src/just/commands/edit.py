@@ -2,11 +2,10 @@ import os
 import typer
 
 from pathlib import Path
-from typing_extensions import Annotated
+from typing import Annotated
 
 from just import just_cli, capture_exception
 from just.core.config import get_env_config_file
-from just.tui import FileEditor
 
 
 INTERNAL_FILES = {
@@ -16,6 +15,9 @@ INTERNAL_FILES = {
 
 def edit_file_by_textual(file_path):
     """Launch the TUI file editor for the specified file"""
+    # textual is heavy, import it only once an editor is actually opened
+    from just.tui import FileEditor
+
     editor = FileEditor(file_path)
     editor.run()
 
@@ -31,7 +33,6 @@ def edit_file(
     """
     Edit file.
     """
-    if file_path.lower() in INTERNAL_FILES:
-        file_path = INTERNAL_FILES[file_path.lower()]
+    file_path = INTERNAL_FILES.get(file_path.lower(), file_path)
 
     edit_file_by_textual(file_path)
@@ -1,24 +1,85 @@
+import importlib
+from typing import Dict, List, Tuple
+
+import typer
+from typer.core import TyperCommand
+
 from just import create_typer_app, just_cli
+from just.utils.typer_utils import NormalizedGroup, normalize_command_name
+
+# Subcommand name -> (module, handler, help). A subcommand's module (add.py
+# pulls in the whole textual TUI) is only imported when that subcommand runs.
+# `help` is the first paragraph of the handler's docstring, kept in sync by
+# tests/test_extension.py.
+lazy_commands: Dict[str, Tuple[str, str, str]] = {
+    "add": ("add", "add_extension", "Register a command as a just extension."),
+    "edit": ("edit", "edit_extension", "Edit an existing just extension using the built-in editor."),
+    "list": ("list", "list_extensions", "List all just extensions in a tree structure."),
+    "remove": ("remove", "remove_extension", "Remove an existing just extension."),
+}
+
+_CONTEXT_SETTINGS = {
+    "add": {"allow_extra_args": True, "ignore_unknown_options": True},
+}
+
+
+class ExtGroup(NormalizedGroup):
+    """
+    A NormalizedGroup that imports the module of an `ext` subcommand on first use.
+
+    While the help page is rendered, subcommands that aren't imported yet are
+    listed from `lazy_commands` instead of being imported.
+    """
+
+    _listing = False
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(lazy_commands))
+
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx, incomplete):
+        # Completing subcommand names only needs their names and help text
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+    def get_command(self, ctx, cmd_name: str):
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None:
+            return cmd
+
+        name = cmd_name if cmd_name in lazy_commands else normalize_command_name(cmd_name)
+        if name not in lazy_commands:
+            if not self._listing and lazy_commands:
+                # Unknown name: load everything so typo suggestions see all commands.
+                # (No list() here: importing .list rebinds `list` in this module.)
+                self._load([*lazy_commands])
+            return super().get_command(ctx, cmd_name)
+
+        if self._listing:
+            return TyperCommand(name, help=lazy_commands[name][2])
+
+        self._load([name])
+        return super().get_command(ctx, name)
+
+    def _load(self, names: List[str]) -> None:
+        for name in names:
+            module_name, handler, _ = lazy_commands.pop(name)
+            module = importlib.import_module(f".{module_name}", __name__)
+            ext_cli.command(name=name, context_settings=_CONTEXT_SETTINGS.get(name))(getattr(module, handler))
+        self.commands.update(typer.main.get_group(ext_cli).commands)
+
 
 # Create and register the ext_cli
-ext_cli = create_typer_app(name="ext", help="Manage just extensions.")
+ext_cli = create_typer_app(name="ext", help="Manage just extensions.", cls=ExtGroup)
 just_cli.add_typer(ext_cli)
 
 __all__ = ["ext_cli"]
-
-# Import commands after ext_cli is created to avoid circular imports
-def _load_commands():
-    """Lazy load all extension commands"""
-    from . import add, edit, list, remove
-    from .add import add_extension
-    from .edit import edit_extension
-    from .list import list_extensions
-    from .remove import remove_extension
-
-    # Register commands
-    ext_cli.command(name="add", context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(add_extension)
-    ext_cli.command(name="edit")(edit_extension)
-    ext_cli.command(name="list")(list_extensions)
-    ext_cli.command(name="remove")(remove_extension)
-
-_load_commands()
\ No newline at end of file
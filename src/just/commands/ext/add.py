@@ -1,11 +1,11 @@
-import subprocess
 import typer
+from pathlib import Path
 from typing import List
 
 from just import echo
+from just.core.config import get_extension_dir
 from just.core.extension.generator import generate_extension_script
 from just.core.extension.utils import split_command_line
-from just.tui.extension import ExtensionTUI
 from just.utils.user_interaction import get_input, confirm_action
 
 
@@ -15,11 +15,23 @@ def show_success(script_path, commands):
     echo.cyan(f"   File: {script_path}")
     echo.echo("")
 
-    # Run -h to show help
+    # Show the help page of the new command
     echo.echo("Help for the new extension:")
     echo.echo("-" * 40)
-    cmd_str = ' '.join(['just'] + commands + ['-h'])
-    subprocess.run(cmd_str, shell=True)
+    show_help(script_path, commands)
+
+
+def show_help(script_path, commands):
+    """Render `just <commands> -h` in this process instead of spawning `just`."""
+    from just.cli import import_script_modules, just_cli
+
+    # The new script isn't in the module cache yet, register it directly
+    module_path = Path(script_path).relative_to(get_extension_dir().parent).with_suffix('')
+    import_script_modules(['.'.join(module_path.parts)])
+    try:
+        just_cli(commands + ['-h'], prog_name='just', standalone_mode=False)
+    except SystemExit:
+        pass
 
 
 def add_extension(
@@ -118,6 +130,8 @@ def add_extension(
 
 def launch_tui():
     """Launch TUI for configuring extension commands"""
+    # textual is heavy, import it only once the TUI is actually opened
+    from just.tui.extension import ExtensionTUI
 
     # Launch the TUI app
     app = ExtensionTUI()
@@ -1,11 +1,9 @@
 import os
 import typer
-from pathlib import Path
 from typing import List, Optional
 
 from just.utils.echo_utils import echo, red, green, yellow, cyan
-from just.core.config import get_extension_dir
-from just.tui.editor import FileEditor
+from just.core.config import get_extension_dir, touch_extensions_dir
 
 
 def edit_extension(
@@ -34,10 +32,10 @@ def edit_extension(
     # Silently apply transformations (no logging)
 
     # Construct the file path
-    script_path = Path(extensions_dir, *sanitized_commands).with_suffix('.py')
+    script_path = os.path.join(extensions_dir, *sanitized_commands) + '.py'
 
     # Check if the file exists
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         red(f"Error: Extension command '{' '.join(commands)}' not found")
         yellow(f"Expected location: {script_path}")
         echo()
@@ -53,9 +51,14 @@ def edit_extension(
     echo("  Ctrl+Q or Escape - Quit")
     echo()
 
+    from just.tui.editor import FileEditor
+
     try:
-        app = FileEditor(str(script_path))
+        app = FileEditor(script_path)
         app.run()
+        # The edit may rename the command or change its help text, which
+        # the module cache holds for `just --help`
+        touch_extensions_dir()
         echo()
         green("Editor closed.")
     except KeyboardInterrupt:
@@ -1,53 +1,92 @@
+import json
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 
-from just.utils.echo_utils import red, green, yellow, blue, cyan, echo
-from just.core.config import get_extension_dir
+from just.utils.echo_utils import red, green, yellow, cyan, echo
+from just.core.config import get_cache_dir, get_extension_dir
+from just.utils.file_utils import mtimes_are_current
 
 
-def find_extensions(extensions_dir: Path) -> Dict[str, List[str]]:
+# Below this many top-level command directories the walk stays sequential
+PARALLEL_WALK_MIN_DIRS = 3
+
+
+def _scan_directory(
+    directory: str,
+    command_parts: Tuple[str, ...],
+    extensions: Dict[str, str],
+    mtimes: Dict[str, int]
+) -> List[Tuple[str, Tuple[str, ...]]]:
+    """
+    Add the extensions directly in `directory` and return its subdirectories.
+
+    The mtimes of the directory and its extension files go into `mtimes`.
+    """
+    subdirs = []
+    try:
+        mtimes[directory] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name != '__pycache__':
+                        subdirs.append((entry.path, command_parts + (name,)))
+                elif name.endswith('.py') and name != '__init__.py':
+                    extensions[' '.join(command_parts + (name[:-3],))] = entry.path
+                    mtimes[entry.path] = entry.stat().st_mtime_ns
+    except OSError:
+        # Unreadable directory, skip it like os.walk does
+        pass
+    return subdirs
+
+
+def _scan_subtree(directory: str, command_parts: Tuple[str, ...]) -> Tuple[Dict[str, str], Dict[str, int]]:
+    # Depth-first walk that visits directories in the same order as os.walk,
+    # carrying the command parts along instead of computing relative paths
+    extensions = {}
+    mtimes = {}
+    stack = [(directory, command_parts)]
+    while stack:
+        subdirs = _scan_directory(*stack.pop(), extensions, mtimes)
+        stack.extend(reversed(subdirs))
+    return extensions, mtimes
+
+
+def find_extensions(extensions_dir: Path, mtimes: Optional[Dict[str, int]] = None) -> Dict[str, List[str]]:
     """
     Find all extensions in the extensions directory.
 
+    Each top-level command directory is walked on its own, in a thread pool
+    when there are enough of them for the scandir calls to overlap.
+
+    Args:
+        extensions_dir: The extensions directory
+        mtimes: If given, filled with the mtime of every walked directory and
+            extension file, for validating the extension index
+
     Returns:
         Dictionary mapping command paths to their file paths
     """
+    if mtimes is None:
+        mtimes = {}
     extensions = {}
+    subdirs = _scan_directory(str(extensions_dir), (), extensions, mtimes)
 
-    # Walk through the extensions directory
-    for root, dirs, files in os.walk(extensions_dir):
-        root_path = Path(root)
-
-        # Skip __pycache__ directories
-        if '__pycache__' in dirs:
-            dirs.remove('__pycache__')
-
-        # Look for Python files (but not __init__.py)
-        py_files = [f for f in files if f.endswith('.py') and f != '__init__.py']
-
-        if py_files:
-            # Get the relative path from extensions_dir
-            try:
-                rel_path = root_path.relative_to(extensions_dir)
-                # Convert to command path (parts of the path)
-                command_parts = list(rel_path.parts)
-
-                for py_file in py_files:
-                    # Remove .py extension
-                    file_stem = py_file[:-3]
-                    # Combine path parts with the file stem
-                    command_path = tuple(command_parts + [file_stem])
-                    full_path = root_path / py_file
-
-                    # Store the mapping
-                    extensions[' '.join(command_path)] = str(full_path)
-            except ValueError:
-                # Path is not relative, skip
-                continue
+    if len(subdirs) < PARALLEL_WALK_MIN_DIRS:
+        subtrees = [_scan_subtree(directory, parts) for directory, parts in subdirs]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
 
+        with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as executor:
+            # map() keeps the results in submission order, so does the output
+            subtrees = executor.map(_scan_subtree, *zip(*subdirs))
+
+    for subtree, subtree_mtimes in subtrees:
+        extensions.update(subtree)
+        mtimes.update(subtree_mtimes)
     return extensions
 
 
@@ -73,45 +112,134 @@ def build_tree_structure(extensions: Dict[str, str]) -> Dict:
     return tree
 
 
-def print_tree_node(node: Dict, prefix: str = "", is_last: bool = True):
+# Escape codes inlined per node; typer.echo still strips them when stdout
+# isn't a terminal
+YELLOW = "\033[33m"
+BLUE = "\033[34m"
+RESET = "\033[0m"
+
+# (extensions dir, its mtime) -> (mtimes, extensions, tree) of the last
+# listing, so repeated listings within one process skip the walk and the tree
+# build while none of the walked directories and files changed
+_TREE_CACHE: Dict[Tuple[str, int], Tuple[Dict[str, int], Dict[str, str], Dict]] = {}
+
+
+_INDEX_CACHE_VERSION = 2
+
+
+def _get_index_cache_file() -> Path:
+    return get_cache_dir() / "extensions.json"
+
+
+def load_index_cache(key: List[Any]) -> Optional[Tuple[Dict[str, int], Dict[str, str]]]:
+    """
+    Return the cached (mtimes, extensions) if they were recorded under `key`
+    and no walked directory or extension file changed since.
+    """
+    try:
+        with open(_get_index_cache_file(), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    mtimes = cached.get("mtimes")
+    if not mtimes_are_current(mtimes) or not isinstance(cached.get("entries"), dict):
+        return None
+    return mtimes, cached["entries"]
+
+
+def save_index_cache(key: List[Any], extensions: Dict[str, str], mtimes: Dict[str, int]) -> None:
+    cache_file = _get_index_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "mtimes": mtimes, "entries": extensions}, f)
+    except OSError:
+        # The cache is an optimization only; a read-only home must not break listing
+        pass
+
+
+def load_extension_tree(extensions_dir: Path) -> Tuple[Dict[str, str], Dict]:
     """
-    Recursively print a tree node.
+    Find the extensions and build their tree structure.
+
+    The previous result is reused while the mtimes of every walked directory
+    and extension file are unchanged (adding, removing or editing an extension
+    at any depth bumps one of them): within a process the built tree, across
+    runs the extension index in the cache directory.
+
+    Returns:
+        Tuple of (extensions, tree)
+    """
+    key = [_INDEX_CACHE_VERSION, str(extensions_dir), os.stat(extensions_dir).st_mtime_ns]
+    cached = _TREE_CACHE.get(tuple(key))
+    if cached is None or not mtimes_are_current(cached[0]):
+        index = load_index_cache(key)
+        if index is None:
+            mtimes = {}
+            extensions = find_extensions(extensions_dir, mtimes)
+            save_index_cache(key, extensions, mtimes)
+        else:
+            mtimes, extensions = index
+        cached = (mtimes, extensions, build_tree_structure(extensions))
+        _TREE_CACHE.clear()
+        _TREE_CACHE[tuple(key)] = cached
+    return cached[1], cached[2]
+
+
+def _child_entries(node: Dict, prefix: str) -> List[Tuple[str, Dict, str, bool]]:
+    # (key, child node, line prefix, is last child) for every child of `node`
+    keys = [k for k in node if k != '__file__']
+    return [(key, node[key], prefix, i == len(keys) - 1) for i, key in enumerate(keys)]
+
+
+def print_tree_node(node: Dict, lines: List[str], prefix: str = "", is_last: bool = True):
+    """
+    Render a tree node and all its descendants.
+
+    Uses an explicit stack instead of recursion, children are pushed in
+    reverse so the lines come out in the same order.
     
     Args:
         node: Tree node dictionary
+        lines: Output buffer the styled lines are appended to
         prefix: Current line prefix for indentation
         is_last: Whether this is the last child
     """
-    items = [(k, v) for k, v in node.items() if k != '__file__']
-    
-    for i, (key, value) in enumerate(items):
-        is_last_item = (i == len(items) - 1)
+    stack = _child_entries(node, prefix)
+    stack.reverse()
+    while stack:
+        key, value, prefix, is_last_item = stack.pop()
         connector = "└──" if is_last_item else "├──"
         
         has_children = any(k != '__file__' for k in value.keys())
         is_command = '__file__' in value
         
         if has_children:
-            echo(f"{prefix}{connector} ", end='')
-            yellow(key)
+            lines.append(f"{prefix}{connector} {YELLOW}{key}{RESET}\n")
         elif is_command:
-            echo(f"{prefix}{connector} ", end='')
-            blue(key)
+            lines.append(f"{prefix}{connector} {BLUE}{key}{RESET}\n")
         else:
-            echo(f"{prefix}{connector} {key}")
+            lines.append(f"{prefix}{connector} {key}\n")
         
         if has_children:
             extension = "    " if is_last_item else "│   "
-            print_tree_node(value, prefix + extension, is_last_item)
+            stack.extend(reversed(_child_entries(value, prefix + extension)))
 
 
-def print_tree_structure(extensions: Dict[str, List[str]], max_width: int = 80) -> None:
+def print_tree_structure(
+    extensions: Dict[str, List[str]],
+    max_width: int = 80,
+    tree: Optional[Dict] = None
+) -> None:
     """
     Print the extensions in a tree structure.
 
     Args:
         extensions: Dictionary mapping command paths to file paths
         max_width: Maximum width for the tree display
+        tree: Tree built from `extensions`, built here if not given
     """
     if not extensions:
         yellow("No extensions found.")
@@ -119,20 +247,25 @@ def print_tree_structure(extensions: Dict[str, List[str]], max_width: int = 80)
         cyan("Tip: Create an extension using 'just ext add'")
         return
 
-    cyan("\nJust Extensions Tree:")
-    echo("=" * max_width)
+    # The whole tree is rendered into one buffer and written at once, rather
+    # than with a separate (styled) write per node
+    lines = [
+        typer.style("\nJust Extensions Tree:\n", fg=typer.colors.CYAN),
+        "=" * max_width + "\n",
+    ]
 
-    tree = build_tree_structure(extensions)
+    if tree is None:
+        tree = build_tree_structure(extensions)
     
     top_commands = sorted(tree.keys())
     for top_cmd in top_commands:
-        echo("\n📦 ", end='')
-        yellow(top_cmd)
-        print_tree_node(tree[top_cmd], prefix="  ", is_last=True)
+        lines.append(f"\n📦 {YELLOW}{top_cmd}{RESET}\n")
+        print_tree_node(tree[top_cmd], lines, prefix="  ", is_last=True)
 
-    echo()
-    echo("=" * max_width)
-    cyan(f"\nTotal: {len(extensions)} extension(s) found")
+    lines.append("\n")
+    lines.append("=" * max_width + "\n")
+    lines.append(typer.style(f"\nTotal: {len(extensions)} extension(s) found\n", fg=typer.colors.CYAN))
+    typer.echo("".join(lines), nl=False)
 
 
 def list_extensions():
@@ -149,7 +282,7 @@ def list_extensions():
         raise typer.Exit(code=0)
 
     # Find all extensions
-    extensions = find_extensions(extensions_dir)
+    extensions, tree = load_extension_tree(extensions_dir)
 
     # Print the tree structure
-    print_tree_structure(extensions)
\ No newline at end of file
+    print_tree_structure(extensions, tree=tree)
\ No newline at end of file
@@ -1,10 +1,12 @@
+import os
 import shutil
 import typer
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 from just.utils.echo_utils import red, green, yellow, cyan, echo
-from just.core.config import get_extension_dir
+from just.core.config import get_extension_dir, touch_extensions_dir
+from just.core.extension.validator import sanitize_command_path
 from just.utils.user_interaction import confirm_action
 
 
@@ -34,16 +36,15 @@ def remove_extension(
     extensions_dir = get_extension_dir()
 
     # Sanitize command names (same as in add.py)
-    from just.core.extension.validator import sanitize_command_path
     sanitized_commands, transformation_notes = sanitize_command_path(commands)
 
     # Silently apply transformations (no logging)
 
     # Construct the file path
-    script_path = Path(extensions_dir, *sanitized_commands).with_suffix('.py')
+    script_path = os.path.join(extensions_dir, *sanitized_commands) + '.py'
 
     # Check if the file exists
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         red(f"Error: Extension command '{' '.join(commands)}' not found")
         yellow(f"Expected location: {script_path}")
         cyan("Tip: Use 'just ext list' to see all available extensions")
@@ -59,11 +60,12 @@ def remove_extension(
 
     try:
         # Delete the script file
-        script_path.unlink()
+        os.unlink(script_path)
         green(f"Removed: {script_path}")
 
         # Clean up empty parent directories and orphan __init__.py files
-        cleanup_count = _cleanup_empty_directories(script_path.parent, extensions_dir)
+        cleanup_count = _cleanup_empty_directories(os.path.dirname(script_path), extensions_dir)
+        touch_extensions_dir()
         if cleanup_count > 0:
             cyan(f"Cleaned up {cleanup_count} empty director{'ies' if cleanup_count > 1 else 'y'}")
         green(f"Extension '{' '.join(sanitized_commands)}' removed successfully!")
@@ -76,7 +78,77 @@ def remove_extension(
         raise typer.Exit(code=1)
 
 
-def _cleanup_empty_directories(start_dir: Path, stop_at: Path) -> int:
+# openat()/unlinkat() style removal, unavailable on Windows
+_SUPPORTS_DIR_FD = {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+
+
+def _remove_pycache(dir_fd: int) -> None:
+    """Remove the __pycache__ directory inside the directory open as `dir_fd`."""
+    try:
+        pycache_fd = os.open('__pycache__', os.O_RDONLY | os.O_DIRECTORY, dir_fd=dir_fd)
+    except FileNotFoundError:
+        return
+    try:
+        with os.scandir(pycache_fd) as it:
+            for entry in it:
+                os.unlink(entry.name, dir_fd=pycache_fd)
+    finally:
+        os.close(pycache_fd)
+    os.rmdir('__pycache__', dir_fd=dir_fd)
+
+
+def _remove_package_dir(directory: str, has_init: bool) -> None:
+    """Remove a directory holding at most __init__.py and __pycache__, by path."""
+    if has_init:
+        os.unlink(os.path.join(directory, '__init__.py'))
+    pycache = os.path.join(directory, '__pycache__')
+    if os.path.isdir(pycache):
+        shutil.rmtree(pycache)
+    os.rmdir(directory)
+
+
+def _is_removable(names: List[str]) -> bool:
+    """Whether a directory listing is empty or an orphan package (only __init__.py)."""
+    contents = [name for name in names if name != '__pycache__']
+    return not contents or contents == ['__init__.py']
+
+
+def _cleanup_with_dir_fd(stop_at: str, parts: List[str]) -> int:
+    """
+    Bottom-up cleanup of stop_at/parts[0]/.../parts[-1] through directory fds.
+
+    Every directory on the path is opened relative to its parent, then listed
+    and removed relative to the open fds, so no path is resolved twice and a
+    directory can't be swapped out between the listing and the removal.
+    """
+    flags = os.O_RDONLY | os.O_DIRECTORY
+    fds = [os.open(stop_at, flags)]
+    try:
+        for name in parts:
+            try:
+                fds.append(os.open(name, flags, dir_fd=fds[-1]))
+            except FileNotFoundError:
+                break
+
+        cleaned = 0
+        # fds[depth] is the directory parts[depth - 1], inside fds[depth - 1]
+        for depth in range(len(fds) - 1, 0, -1):
+            fd = fds[depth]
+            names = os.listdir(fd)
+            if not _is_removable(names):
+                break
+            if '__init__.py' in names:
+                os.unlink('__init__.py', dir_fd=fd)
+            _remove_pycache(fd)
+            os.rmdir(parts[depth - 1], dir_fd=fds[depth - 1])
+            cleaned += 1
+        return cleaned
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _cleanup_empty_directories(start_dir: Union[str, Path], stop_at: Union[str, Path]) -> int:
     """
     Clean up empty directories and orphan __init__.py files.
 
@@ -91,41 +163,28 @@ def _cleanup_empty_directories(start_dir: Path, stop_at: Path) -> int:
     Returns:
         Number of directories cleaned up
     """
-    cleaned = 0
-    current = start_dir
+    stop_at = os.path.normpath(stop_at)
+    current = os.path.normpath(start_dir)
+    if not current.startswith(stop_at + os.sep):
+        return 0
+
+    if _SUPPORTS_DIR_FD:
+        return _cleanup_with_dir_fd(stop_at, current[len(stop_at) + 1:].split(os.sep))
 
-    while current != stop_at and current.is_relative_to(stop_at):
-        if not current.exists():
-            current = current.parent
+    cleaned = 0
+    while current.startswith(stop_at + os.sep):
+        try:
+            names = os.listdir(current)
+        except FileNotFoundError:
+            current = os.path.dirname(current)
             continue
 
-        # Get directory contents (excluding __pycache__)
-        contents = [
-            item for item in current.iterdir()
-            if item.name != '__pycache__'
-        ]
-
-        # Check if directory is empty or only contains __init__.py
-        if len(contents) == 0:
-            # Empty directory, remove it
-            # Also remove __pycache__ if it exists
-            pycache = current / '__pycache__'
-            if pycache.exists():
-                shutil.rmtree(pycache)
-            current.rmdir()
-            cleaned += 1
-        elif len(contents) == 1 and contents[0].name == '__init__.py':
-            # Only contains __init__.py (orphan package), remove both
-            contents[0].unlink()
-            pycache = current / '__pycache__'
-            if pycache.exists():
-                shutil.rmtree(pycache)
-            current.rmdir()
-            cleaned += 1
-        else:
-            # Directory has other contents, stop cleaning
+        # Otherwise the directory still holds other extensions: stop cleaning
+        if not _is_removable(names):
             break
+        _remove_package_dir(current, has_init='__init__.py' in names)
+        cleaned += 1
 
-        current = current.parent
+        current = os.path.dirname(current)
 
     return cleaned
@@ -1,17 +1,19 @@
+import os
 import typer
 from pathlib import Path
 from typing import Optional
 
 from just import Annotated, just_cli, capture_exception
 from just.utils import echo
-from just.utils.archive import extract as archive_extract, detect_archive_format, ArchiveFormat
+from just.utils.archive import extract as archive_extract, detect_archive_format, ArchiveFormat, strip_archive_extension
 
 
 def get_default_output_dir(archive_path: str) -> str:
     """
     Get default output directory from archive filename.
     
-    Simply removes all extensions by taking everything before the first dot.
+    Strips the archive extension (e.g. '.tar.gz') from the file name. Names
+    without a known archive extension lose their last suffix instead.
     
     Args:
         archive_path: Path to the archive file
@@ -19,7 +21,10 @@ def get_default_output_dir(archive_path: str) -> str:
     Returns:
         Directory name without extensions
     """
-    return archive_path.split(".")[0]
+    output_dir = strip_archive_extension(archive_path)
+    if output_dir == archive_path:
+        output_dir = os.path.splitext(archive_path)[0]
+    return output_dir
 
 
 @just_cli.command(name="extract")
@@ -1,6 +1,5 @@
 import typer
-from typing import List, Optional
-from typing_extensions import Annotated
+from typing import Annotated, List, Optional
 
 from rich.console import Console
 from rich.table import Table
@@ -1,14 +1,106 @@
 import os
+import sys
+import errno
 import typer
 import shutil
 from pathlib import Path
-from typing_extensions import Annotated
+from stat import S_ISDIR
+from typing import Annotated, Iterator, Optional
 
 from just import just_cli, capture_exception, echo
-from just.utils.file_utils import read_file_text
+from just.utils.file_utils import fast_copy2
 from just.utils import confirm_action
 
 
+# `st_mode & 0o777` -> "rwxr-xr-x"-style string for `ls -l`. Composed from
+# the eight rwx triads, which keeps building it at import time cheap
+_RWX = ("---", "--x", "-w-", "-wx", "r--", "r-x", "rw-", "rwx")
+_PERMISSION_STRINGS = tuple(user + group + other for user in _RWX for group in _RWX for other in _RWX)
+
+# Read size for `cat -n`, which streams instead of loading the whole file
+CAT_CHUNK_SIZE = 1 << 20
+
+# Shared by rm/cp/mv, so the option is built once instead of per command
+YesOption = Annotated[bool, typer.Option(
+    "--yes", "-y",
+    help="Skip confirmation prompts"
+)]
+
+
+def _stat(path) -> Optional[os.stat_result]:
+    """os.stat() the path, or None if it doesn't exist.
+
+    One call answers both "does it exist" and "is it a directory", where
+    Path.exists() followed by Path.is_dir() costs a stat() each.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _copy_file_to_stdout(file_path: str):
+    """Write a file's bytes to stdout unchanged, in-kernel where possible."""
+    with open(file_path, "rb") as f:
+        # Anything echoed earlier must reach stdout before the raw bytes
+        sys.stdout.flush()
+        offset, size = 0, os.fstat(f.fileno()).st_size
+        if hasattr(os, "sendfile"):
+            try:
+                out_fd = sys.stdout.fileno()
+                while offset < size:
+                    sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                # e.g. macOS only sends to sockets, or stdout has no fd;
+                # finish with plain reads
+                pass
+        f.seek(offset)
+        shutil.copyfileobj(f, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+
+
+def _read_chunks(f) -> Iterator[bytes]:
+    return iter(lambda: f.read(CAT_CHUNK_SIZE), b"")
+
+
+def _write_numbered_file_to_stdout(file_path: str):
+    """Write a file to stdout with right-aligned `N→` line number prefixes.
+
+    The file is streamed in chunks, so memory stays bounded by the chunk
+    size: a first pass counts newlines for the number width, a second one
+    writes the numbered lines.
+    """
+    # Lines stay bytes; only the separator is encoded, once
+    number_sep = "→".encode(getattr(sys.stdout, "encoding", None) or "utf-8", errors="replace")
+    with open(file_path, "rb") as f:
+        line_count, last = 0, b""
+        for chunk in _read_chunks(f):
+            line_count += chunk.count(b"\n")
+            last = chunk
+        if last and not last.endswith(b"\n"):
+            line_count += 1
+        width = len(str(line_count))
+        f.seek(0)
+
+        sys.stdout.flush()
+        out = sys.stdout.buffer
+        lineno, carry = 1, b""
+        for chunk in _read_chunks(f):
+            lines = (carry + chunk).split(b"\n")
+            # The last piece has no newline yet; it continues in the next chunk
+            carry = lines.pop()
+            out.write(b"".join(
+                b"%*d%s%s\n" % (width, i, number_sep, line) for i, line in enumerate(lines, lineno)
+            ))
+            lineno += len(lines)
+        if carry:
+            out.write(b"%*d%s%s" % (width, lineno, number_sep, carry))
+        out.flush()
+
+
 @just_cli.command(name="cat")
 @capture_exception
 def cat_file(
@@ -25,14 +117,22 @@ def cat_file(
     Concatenate and print files.
     """
     for file_path in file_paths:
-        if os.path.isdir(file_path):
-            echo.red(f"cat: {file_path} is a directory")
-            exit(1)
+        # No isdir() pre-check: open() itself reports directories
         try:
-            echo.echo(read_file_text(file_path, with_line_numbers=with_line_numbers))
+            if with_line_numbers:
+                # Numbers are right-aligned to the line count, so this needs the whole file
+                _write_numbered_file_to_stdout(file_path)
+            else:
+                _copy_file_to_stdout(file_path)
         except FileNotFoundError:
             echo.red(f"cat: The file {file_path} does not exist")
             exit(1)
+        except (IsADirectoryError, PermissionError):
+            # Windows reports opening a directory as PermissionError
+            if not os.path.isdir(file_path):
+                raise
+            echo.red(f"cat: {file_path} is a directory")
+            exit(1)
 
 
 @just_cli.command(name="ls")
@@ -54,32 +154,43 @@ def list_files(
     """
     List directory contents.
     """
-    p = Path(path)
-    if not p.exists():
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         echo.red(f"ls: cannot access '{path}': No such file or directory")
         exit(1)
 
-    if not p.is_dir():
+    if not S_ISDIR(st.st_mode):
+        name = Path(path).name
         if long_format:
-            stat = p.stat()
-            echo.echo(f"-rw-r--r-- 1 user group {stat.st_size:>8} {p.name}")
+            echo.echo(f"-{_PERMISSION_STRINGS[st.st_mode & 0o777]} 1 user group {st.st_size:>8} {name}")
         else:
-            echo.echo(p.name)
+            echo.echo(name)
         return
 
-    entries = list(p.iterdir())
-    if not all_format:
-        entries = [entry for entry in entries if not entry.name.startswith('.')]
-
-    if long_format:
-        for entry in entries:
-            stat = entry.stat()
-            permissions = "drwxr-xr-x" if entry.is_dir() else "-rw-r--r--"
-            size = stat.st_size
-            echo.echo(f"{permissions} 1 user group {size:>8} {entry.name}")
+    if not long_format:
+        # Only names are needed: plain strings, no DirEntry per entry
+        lines = [name for name in os.listdir(path) if all_format or not name.startswith('.')]
     else:
-        for entry in entries:
-            echo.echo(entry.name)
+        # Every entry is stat()ed: scanning an open directory fd turns those
+        # into fstatat() calls relative to it, so the directory's own path
+        # isn't resolved again for each entry.
+        dir_fd = os.open(path, os.O_RDONLY) if os.scandir in os.supports_fd else None
+        try:
+            lines = []
+            with os.scandir(path if dir_fd is None else dir_fd) as it:
+                for entry in it:
+                    if not all_format and entry.name.startswith('.'):
+                        continue
+                    entry_st = entry.stat()
+                    file_type = "d" if S_ISDIR(entry_st.st_mode) else "-"
+                    permissions = _PERMISSION_STRINGS[entry_st.st_mode & 0o777]
+                    lines.append(f"{file_type}{permissions} 1 user group {entry_st.st_size:>8} {entry.name}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    if lines:
+        echo.echo("\n".join(lines))
 
 
 @just_cli.command(name="mkdir")
@@ -97,11 +208,31 @@ def make_directory(
     """
     Create directories.
     """
-    for dir_name in dir_names:
-        if make_parents:
-            os.makedirs(dir_name, exist_ok=True)
-        else:
+    if not make_parents:
+        for dir_name in dir_names:
             os.mkdir(dir_name)
+        return
+
+    # Shared prefixes (a/b for `a/b/c a/b/d`) are created once, parents first
+    prefixes = {}
+    for dir_name in dir_names:
+        path = Path(dir_name)
+        parts = path.parts
+        # The anchor (`/`, `C:\`) always exists and isn't created: on Windows
+        # mkdir on a drive root fails with PermissionError
+        prefix = parts[0] if path.anchor else ""
+        for part in parts[1:] if path.anchor else parts:
+            prefix = os.path.join(prefix, part)
+            prefixes[prefix] = None
+
+    for prefix in prefixes:
+        try:
+            os.mkdir(prefix)
+        except OSError:
+            # Existing directories may also report EACCES/EPERM instead of
+            # EEXIST (e.g. an unwritable parent), like os.makedirs tolerates
+            if not os.path.isdir(prefix):
+                raise
 
 
 @just_cli.command(name="rm")
@@ -115,26 +246,35 @@ def remove_files(
         "--recursive", "-r",
         help="Remove directories and their contents recursively"
     )] = False,
-    yes: Annotated[bool, typer.Option(
-        "--yes", "-y",
-        help="Skip confirmation prompts"
+    yes: YesOption = False,
+    force: Annotated[bool, typer.Option(
+        "--force", "-f",
+        help="Ignore nonexistent files and never prompt"
     )] = False
 ):
     """
     Remove files or directories.
     """
     for target in targets:
-        target_path = Path(target)
-        if not target_path.exists():
+        # Try the unlink first: for files (the common case) that is the only
+        # syscall, and its error tells missing targets and directories apart
+        try:
+            os.remove(target)
+            continue
+        except FileNotFoundError:
+            if force:
+                continue
             echo.red(f"rm: cannot remove '{target}': No such file or directory")
             exit(1)
-        if target_path.is_dir():
-            # Prompt for confirmation when removing directory without -r
-            if not recursive and not yes and not confirm_action(f"rm: descend into directory '{target}'?"):
-                continue
-            shutil.rmtree(target_path)
-        else:
-            os.remove(target_path)
+        except (IsADirectoryError, PermissionError):
+            # unlink() of a directory fails with EISDIR on Linux, EPERM/EACCES elsewhere
+            if not os.path.isdir(target):
+                raise
+
+        # Prompt for confirmation when removing directory without -r
+        if not (recursive or yes or force) and not confirm_action(f"rm: descend into directory '{target}'?"):
+            continue
+        shutil.rmtree(target)
 
 
 @just_cli.command(name="cp")
@@ -152,10 +292,7 @@ def copy_files(
         "--recursive", "-r",
         help="Copy directories recursively"
     )] = False,
-    yes: Annotated[bool, typer.Option(
-        "--yes", "-y",
-        help="Skip confirmation prompts"
-    )] = False
+    yes: YesOption = False
 ):
     """
     Copy files or directories.
@@ -163,23 +300,25 @@ def copy_files(
     source_path = Path(source)
     dest_path = Path(destination)
 
-    if not source_path.exists():
+    source_st = _stat(source_path)
+    if source_st is None:
         echo.red(f"cp: cannot stat '{source}': No such file or directory")
         exit(1)
 
 
-    if source_path.is_dir():
+    if S_ISDIR(source_st.st_mode):
         if not recursive:
             # Prompt for confirmation when copying directory without -r
             if not yes and not confirm_action(f"cp: -r not specified; omitting directory '{source}'"):
                 exit(1)
-        if dest_path.exists() and dest_path.is_dir():
+        dest_st = _stat(dest_path)
+        if dest_st is not None and S_ISDIR(dest_st.st_mode):
             # Copy directory into existing directory
-            shutil.copytree(source_path, dest_path / source_path.name)
+            shutil.copytree(source_path, dest_path / source_path.name, copy_function=fast_copy2)
         else:
-            shutil.copytree(source_path, dest_path)
+            shutil.copytree(source_path, dest_path, copy_function=fast_copy2)
     else:
-        shutil.copy2(source_path, dest_path)
+        fast_copy2(source_path, dest_path)
 
 
 @just_cli.command(name="mv")
@@ -193,21 +332,35 @@ def move_files(
         help="Destination file or directory",
         show_default=False
     )],
-    yes: Annotated[bool, typer.Option(
-        "--yes", "-y",
-        help="Skip confirmation prompts"
-    )] = False
+    yes: YesOption = False
 ):
     """
     Move or rename files or directories.
     """
-    source_path = Path(source)
-    dest_path = Path(destination)
+    # The source is only checked up front when there is an overwrite to
+    # confirm; otherwise the move itself reports a missing source
+    dest_stat = _stat(destination)
+    if dest_stat is not None:
+        if _stat(source) is None:
+            echo.red(f"mv: cannot stat '{source}': No such file or directory")
+            exit(1)
+        if not yes and not confirm_action(f"mv: overwrite '{destination}'?"):
+            exit(1)
 
-    if not source_path.exists():
+    try:
+        if dest_stat is not None and S_ISDIR(dest_stat.st_mode):
+            # Moving into a directory: shutil.move works out the target name
+            shutil.move(source, destination)
+        else:
+            # Same filesystem: a single rename(2)
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)
+    except FileNotFoundError:
+        if os.path.lexists(source):
+            raise
         echo.red(f"mv: cannot stat '{source}': No such file or directory")
         exit(1)
-    if dest_path.exists() and not yes and not confirm_action(f"mv: overwrite '{destination}'?"):
-        exit(1)
-
-    shutil.move(str(source_path), str(dest_path))
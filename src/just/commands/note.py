@@ -1,5 +1,4 @@
 from just import just_cli, capture_exception
-from just.tui import WorkspaceApp
 from just.utils.note_utils import get_notes_dir
 
 
@@ -7,6 +6,9 @@ from just.utils.note_utils import get_notes_dir
 @capture_exception
 def note_command():
     """Edit notes in ~/.just/notes directory."""
+    # textual is heavy, import it only once the editor is actually opened
+    from just.tui.workspace import WorkspaceApp
+
     notes_dir = get_notes_dir()
     notes_dir.mkdir(parents=True, exist_ok=True)
     WorkspaceApp(str(notes_dir)).run()
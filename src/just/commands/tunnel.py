@@ -1,14 +1,14 @@
+import os
+import sys
+
 import typer
 
-from typing_extensions import Annotated
+from typing import Annotated
 
-from just import create_typer_app, capture_exception, just_cli
+from just import capture_exception, echo, just_cli
 from just.utils import execute_command
 
 
-tunnel_cli = create_typer_app()
-
-
 @just_cli.command(name="tunnel")
 @capture_exception
 def create_cloudflare_tunnel(
@@ -20,8 +20,15 @@ def create_cloudflare_tunnel(
     """
     Create Cloudflare tunnel.
     """
-    command = r"""
-    cloudflared tunnel --url <URL>
-    """
-    command = command.replace('<URL>', url)
-    execute_command(command)
+    argv = ["cloudflared", "tunnel", "--url", url]
+    if os.name == "posix":
+        # Nothing runs after the tunnel exits, so rather than waiting on a
+        # child process, replace this one with cloudflared
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp(argv[0], argv)
+        except FileNotFoundError:
+            echo.error("cloudflared not found. Install it with: just install cloudflare")
+            exit(1)
+    execute_command(argv)
@@ -1,15 +1,17 @@
 import typer
 
 from pathlib import Path
-from typing_extensions import Annotated
+from typing import Annotated
 
 from just import just_cli
-from just.tui.markdown import MarkdownApp
 from just.commands.edit import edit_file
 
 
 def view_markdown_by_textual(file_path: str):
     """View markdown file."""
+    # textual is heavy, import it only once the viewer is actually opened
+    from just.tui.markdown import MarkdownApp
+
     app = MarkdownApp()
     app.path = Path(file_path)
     app.run()
@@ -25,8 +27,7 @@ def view_file(
     """
     Preview the structured text files (e.g., Markdown, JSON, XML)
     """
-    ext = "".join(Path(file_path).suffixes)
-    if ext == '.md':
+    if file_path.endswith('.md'):
         view_markdown_by_textual(file_path)
     # TODO: support other file types
     else:
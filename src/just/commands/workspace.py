@@ -1,10 +1,9 @@
 from pathlib import Path
-from typing_extensions import Annotated
+from typing import Annotated
 
 import typer
 
 from just import just_cli, capture_exception
-from just.tui.workspace import WorkspaceApp
 
 
 @just_cli.command(name="code")
@@ -20,5 +19,8 @@ def workspace_command(
         print(f"Error: Path does not exist: {workspace_path}")
         return
 
+    # textual is heavy, import it only once the editor is actually opened
+    from just.tui.workspace import WorkspaceApp
+
     app = WorkspaceApp(str(workspace_path))
     app.run()
@@ -12,6 +12,7 @@ from .utils import (
     load_system_config,
     save_system_config,
     update_env_config,
+    touch_extensions_dir,
     is_initialized
 )
 
@@ -30,5 +31,6 @@ __all__ = [
     "ensure_extensions_dir_exists",
     "ensure_config_dir_exists",
     "save_system_config",
+    "touch_extensions_dir",
     "is_initialized"
 ]
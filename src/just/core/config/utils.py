@@ -1,5 +1,7 @@
 """JUST CLI Configuration Utility Functions"""
-from dotenv import load_dotenv, set_key
+import os
+
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +9,7 @@ from just.core.system_probe.system_info import SystemConfig
 from just.utils.file_utils import write_file
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get JUST configuration directory path"""
     home = Path.home()
@@ -25,16 +28,19 @@ def ensure_config_dir_exists() -> Path:
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_extension_dir() -> Path:
     """Get user extensions directory path"""
     return get_config_dir() / "extensions"
 
 
+@lru_cache(maxsize=1)
 def get_command_dir() -> Path:
     """Get user commands directory path"""
     return Path(__file__).parent.parent.parent / "commands"
 
 
+@lru_cache(maxsize=1)
 def get_basic_installer_dir() -> Path:
     """Get basic installer directory path"""
     return Path(__file__).parent.parent.parent / "installers"
@@ -47,6 +53,13 @@ def ensure_extensions_dir_exists() -> Path:
     return extensions_dir
 
 
+def touch_extensions_dir() -> None:
+    """Bump the extensions directory mtime so cached module lists are rebuilt"""
+    extensions_dir = get_extension_dir()
+    if extensions_dir.exists():
+        os.utime(extensions_dir)
+
+
 def get_env_config_file() -> Path:
     """Get JUST environment configuration file path"""
     return get_config_dir() / ".env"
@@ -54,10 +67,17 @@ def get_env_config_file() -> Path:
 
 def load_env_config():
     env_config_file = get_env_config_file()
-    if not env_config_file.exists():
+    try:
+        if os.stat(env_config_file).st_size == 0:
+            # Nothing to load: skip importing python-dotenv on every startup
+            return
+    except FileNotFoundError:
         ensure_config_dir_exists()
         write_file(str(env_config_file), "")
-    load_dotenv(get_env_config_file())
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv(env_config_file)
 
 
 def update_env_config(key: str, value: str):
@@ -65,7 +85,9 @@ def update_env_config(key: str, value: str):
     if not env_config_file.exists():
         ensure_config_dir_exists()
         write_file(str(env_config_file), "")
-    set_key(get_env_config_file(), key, value)
+
+    from dotenv import set_key
+    set_key(env_config_file, key, value)
 
 
 def _get_system_info_file() -> Path:
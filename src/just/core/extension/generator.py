@@ -1,14 +1,27 @@
-import os
+import re
+
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from just.core.config import get_extension_dir, get_command_dir
+from just.core.config import get_extension_dir, get_command_dir, touch_extensions_dir
 from just.core.extension.parser import parse_command_structure, Argument
 from just.core.extension.utils import search_existing_script
 from just.core.extension.validator import sanitize_command_path, validate_command_names
+from just.utils.file_utils import write_file
 from just.utils.format_utils import docstring
 
 
+def _strip_just(just_commands: List[str]) -> List[str]:
+    """Drop a leading 'just' from the command parts.
+
+    The parts are only read, never mutated, so they are returned as they are
+    when there's nothing to drop instead of being copied.
+    """
+    if just_commands and just_commands[0] == 'just':
+        return just_commands[1:]
+    return just_commands
+
+
 def validate_command_input(just_commands: List[str]) -> None:
     """
     Validate the command input structure.
@@ -33,10 +46,7 @@ def get_command_paths(just_commands: List[str]) -> Tuple[Path, Path]:
     Returns:
         Tuple of (script_path, directory_path)
     """
-    # Remove 'just' if it's the first command
-    commands = just_commands.copy()
-    if commands and commands[0] == 'just':
-        commands.pop(0)
+    commands = _strip_just(just_commands)
 
     if not commands:
         raise ValueError("No command specified")
@@ -58,7 +68,8 @@ def get_command_paths(just_commands: List[str]) -> Tuple[Path, Path]:
     # Calculate paths - extensions for extension commands
     extensions_dir = get_extension_dir()
 
-    script_path = Path(os.path.join(extensions_dir, *sanitized_commands) + '.py')
+    # Suffix appended to the last part: with_suffix() would eat a dotted name
+    script_path = extensions_dir.joinpath(*sanitized_commands[:-1], sanitized_commands[-1] + '.py')
     directory_path = script_path.parent
 
     return script_path, directory_path
@@ -71,21 +82,50 @@ def ensure_command_directories_exist(just_commands: List[str]) -> None:
     Args:
         just_commands: List of command parts
     """
-    # Remove 'just' if it's the first command
-    commands = just_commands.copy()
-    if commands and commands[0] == 'just':
-        commands.pop(0)
+    commands = _strip_just(just_commands)
 
     if not commands:
         return
 
     extensions_dir = get_extension_dir()
 
-    # Create intermediate directories
-    for i in range(len(commands) - 1):
-        dir_path = Path(os.path.join(extensions_dir, *commands[:i+1]))
-        if not dir_path.exists():
-            dir_path.mkdir(parents=True, exist_ok=True)
+    # Create intermediate directories: making the deepest one creates the rest
+    if len(commands) > 1:
+        extensions_dir.joinpath(*commands[:-1]).mkdir(parents=True, exist_ok=True)
+
+
+# __init__.py templates for command packages, dedented once at import
+# rather than on every generated package
+_BUILTIN_PARENT_INIT_TEMPLATE = docstring("""
+    from just.commands.{name} import {name}_cli
+
+
+    __all__ = ["{name}_cli"]
+    """)
+
+_ROOT_INIT_TEMPLATE = docstring("""
+    from just import just_cli, create_typer_app
+
+
+    {name}_cli = create_typer_app(name="{name}")
+    # Add the CLI to the just CLI
+    just_cli.add_typer({name}_cli)
+
+    __all__ = ["{name}_cli"]
+    """)
+
+_NESTED_INIT_TEMPLATE = docstring("""
+    from just import create_typer_app
+
+    from .. import {parent}_cli
+
+
+    {name}_cli = create_typer_app(name="{name}")
+    # Add the CLI to the parent CLI
+    {parent}_cli.add_typer({name}_cli)
+
+    __all__ = ["{name}_cli"]
+    """)
 
 
 def generate_package_init_files(just_commands: List[str]) -> None:
@@ -95,10 +135,7 @@ def generate_package_init_files(just_commands: List[str]) -> None:
     Args:
         just_commands: List of command parts
     """
-    # Remove 'just' if it's the first command
-    commands = just_commands.copy()
-    if commands and commands[0] == 'just':
-        commands.pop(0)
+    commands = _strip_just(just_commands)
 
     if not commands:
         return
@@ -108,81 +145,88 @@ def generate_package_init_files(just_commands: List[str]) -> None:
 
     # Create __init__.py files for intermediate packages
     for i in range(len(commands) - 1):
-        package_dir = Path(os.path.join(extensions_dir, *commands[:i+1]))
+        package_dir = extensions_dir.joinpath(*commands[:i+1])
         init_file = package_dir / '__init__.py'
 
-        if not init_file.exists():
-            if i == 0:
-                # Check if the parent command already exists in commands directory
-                parent_init_file = Path(os.path.join(commands_dir, commands[0], '__init__.py'))
-                if parent_init_file.exists():
-                    # Import from commands directory instead of creating new CLI
-                    content = docstring(f"""
-                    from just.commands.{commands[0]} import {commands[0]}_cli
-
-
-                    __all__ = ["{commands[0]}_cli"]
-                    """)
-                else:
-                    # Create new CLI as usual
-                    content = docstring(f"""
-                    from just import just_cli, create_typer_app
+        if i == 0:
+            # Check if the parent command already exists in commands directory
+            parent_init_file = commands_dir / commands[0] / '__init__.py'
+            if parent_init_file.exists():
+                # Import from commands directory instead of creating new CLI
+                content = _BUILTIN_PARENT_INIT_TEMPLATE.format(name=commands[0])
+            else:
+                # Create new CLI as usual
+                content = _ROOT_INIT_TEMPLATE.format(name=commands[0])
+        else:
+            content = _NESTED_INIT_TEMPLATE.format(name=commands[i], parent=commands[i-1])
 
+        # Exclusive create: one open() both checks for an existing package
+        # (left untouched) and creates a missing one, instead of exists() + open()
+        try:
+            with open(init_file, 'xb') as f:
+                f.write(content.encode('utf-8'))
+        except FileExistsError:
+            pass
 
-                    {commands[0]}_cli = create_typer_app(name="{commands[0]}")
-                    # Add the CLI to the just CLI
-                    just_cli.add_typer({commands[0]}_cli)
 
-                    __all__ = ["{commands[0]}_cli"]
-                    """)
-            else:
-                content = docstring(f"""
-                from just import create_typer_app
+def assign_variable_names(arguments: List[Argument], options: dict) -> Tuple[List[str], List[str]]:
+    """
+    Assign a unique Python variable name to every argument and option.
 
-                from .. import {commands[i-1]}_cli
+    The signature and the replacement logic both refer to these names, so
+    they are worked out once and shared.
 
+    Args:
+        arguments: List of command arguments
+        options: Dictionary of command options
 
-                {commands[i]}_cli = create_typer_app(name="{commands[i]}")
-                # Add the CLI to the parent CLI
-                {commands[i-1]}_cli.add_typer({commands[i]}_cli)
+    Returns:
+        Tuple of (argument names, option names), in input order. Varargs
+        get None: they are read from ctx.args, not a function parameter.
+    """
+    # Names the generated function body uses itself
+    used_names = {'_re', '_placeholders'}
 
-                __all__ = ["{commands[i]}_cli"]
-                """)
+    def unique(name: str) -> str:
+        var_name = name
+        counter = 1
+        while var_name in used_names:
+            var_name = f"{name}_{counter}"
+            counter += 1
+        used_names.add(var_name)
+        return var_name
 
-            with open(init_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+    argument_names = [None if arg.is_varargs else unique(arg.name) for arg in arguments]
+    option_names = [unique(opt.name) for opt in options.values()]
+    return argument_names, option_names
 
 
-def generate_function_signature(arguments: List[Argument], options: dict) -> str:
+def generate_function_signature(
+    arguments: List[Argument],
+    options: dict,
+    variable_names: Optional[Tuple[List[str], List[str]]] = None
+) -> str:
     """
     Generate the function signature for the Typer command.
 
     Args:
         arguments: List of command arguments
         options: Dictionary of command options
+        variable_names: Result of assign_variable_names, computed if not given
 
     Returns:
         Formatted function signature string
     """
+    argument_names, option_names = variable_names or assign_variable_names(arguments, options)
+
     # Collect all parameters with their default status for sorting
     params_without_default = []
     params_with_default = []
 
-    # Track variable names to avoid duplicates
-    used_names = set()
-
     # Add arguments (skip varargs - they use ctx.args instead)
-    for arg in arguments:
+    for arg, var_name in zip(arguments, argument_names):
         if arg.is_varargs:
             continue  # Varargs are handled via ctx.args, not function parameter
-        
-        # Ensure unique variable names
-        var_name = arg.name
-        counter = 1
-        while var_name in used_names:
-            var_name = f"{arg.name}_{counter}"
-            counter += 1
-        used_names.add(var_name)
 
         default_assignment = ""
         has_default = False
@@ -208,14 +252,7 @@ def generate_function_signature(arguments: List[Argument], options: dict) -> str
 
 
     # Add options processing
-    for flag, opt in options.items():
-        # Ensure unique variable names
-        var_name = opt.name
-        counter = 1
-        while var_name in used_names:
-            var_name = f"{opt.name}_{counter}"
-            counter += 1
-        used_names.add(var_name)
+    for (flag, opt), var_name in zip(options.items(), option_names):
 
         default_assignment = ""
         has_default = False
@@ -265,63 +302,81 @@ def generate_function_signature(arguments: List[Argument], options: dict) -> str
     if not all_params:
         return '\n'
 
-    formatted_params = []
-    for i, param in enumerate(all_params):
-        if i < len(all_params) - 1:
-            formatted_params.append(param + ",\n")
-        else:
-            formatted_params.append(param + "\n")
+    return ',\n'.join(all_params) + '\n\n'
 
-    return ''.join(formatted_params) + '\n'
 
+def _placeholder_substitution(placeholders: dict) -> List[str]:
+    """
+    Generate the lines substituting a run of placeholders in one step.
 
-def generate_command_replacements(arguments: List[Argument], options: dict) -> str:
+    Several placeholders are replaced with a single regex pass instead of a
+    str.replace() scan each. Longest identifiers go first, so one that
+    contains another still wins, and a substituted value is never rescanned
+    for the other placeholders of the same run.
+
+    Args:
+        placeholders: Placeholder identifier -> variable name
+
+    Returns:
+        Lines of the generated function body (may be empty)
+    """
+    if len(placeholders) == 1:
+        [(identifier, var_name)] = placeholders.items()
+        return [f"    command = command.replace({repr(identifier)}, str({var_name}))"]
+    if not placeholders:
+        return []
+
+    pattern = '|'.join(re.escape(identifier) for identifier in sorted(placeholders, key=len, reverse=True))
+    values = ', '.join(f"{repr(identifier)}: str({var_name})" for identifier, var_name in placeholders.items())
+    # Underscored names: user parameters can't shadow them (see assign_variable_names)
+    return [
+        f"    _placeholders = {{{values}}}",
+        f"    command = _re.sub({repr(pattern)}, lambda m: _placeholders[m.group(0)], command)",
+    ]
+
+
+def generate_command_replacements(
+    arguments: List[Argument],
+    options: dict,
+    variable_names: Optional[Tuple[List[str], List[str]]] = None
+) -> str:
     """
     Generate the command replacement logic.
 
     Args:
         arguments: List of command arguments
         options: Dictionary of command options
+        variable_names: Result of assign_variable_names, computed if not given
 
     Returns:
         Formatted command replacement string
     """
-    # Create mapping of original names to new names
-    name_mapping = {}
-
-    # Map arguments
-    arg_counter = 1
-    for arg in arguments:
-        var_name = arg.name
-        while var_name in name_mapping.values():
-            var_name = f"{arg.name}_{arg_counter}"
-            arg_counter += 1
-        name_mapping[arg.name] = var_name
-
-    # Map options
-    opt_counter = 1
-    for flag, opt in options.items():
-        var_name = opt.name
-        while var_name in name_mapping.values():
-            var_name = f"{opt.name}_{opt_counter}"
-            opt_counter += 1
-        name_mapping[opt.name] = var_name
+    argument_names, option_names = variable_names or assign_variable_names(arguments, options)
+
+    # Consecutive unconditional placeholder -> variable substitutions are
+    # emitted together; any other step flushes them first, so every step
+    # still runs in the same order as the placeholders and options
+    placeholders = {}
 
     # Generate replacements for arguments (skip varargs - handled in template)
     command_replacements = []
-    for arg in arguments:
+    for arg, var_name in zip(arguments, argument_names):
         if arg.is_varargs:
             continue  # Varargs replacement is handled in the template
-        var_name = name_mapping[arg.name]
-        command_replacements.append(
-            f"    command = command.replace({repr(arg.repl_identifier)}, str({var_name}))"
-        )
+        placeholders.setdefault(arg.repl_identifier, var_name)
 
 
     # Generate replacements for options
-    for flag, opt in options.items():
-        var_name = name_mapping[opt.name]
+    for (flag, opt), var_name in zip(options.items(), option_names):
         
+        if not opt.is_append_option and opt.type.__name__ != 'bool' and not opt.repl_identifier.startswith('-'):
+            # Normal placeholder replacement
+            placeholders.setdefault(opt.repl_identifier, var_name)
+            continue
+
+        command_replacements.extend(_placeholder_substitution(placeholders))
+        placeholders.clear()
+
         # Check if this is an append option (no placeholder, append to command)
         if opt.is_append_option:
             # For append options, add the original flag and value to the command
@@ -384,11 +439,8 @@ def generate_command_replacements(arguments: List[Argument], options: dict) -> s
                     command_replacements.append(
                         f"        command = command.replace({repr(opt.repl_identifier)}, '')"
                     )
-            else:
-                # Normal placeholder replacement
-                command_replacements.append(
-                    f"    command = command.replace({repr(opt.repl_identifier)}, str({var_name}))"
-                )
+
+    command_replacements.extend(_placeholder_substitution(placeholders))
 
     if command_replacements:
         command_replacements[0] = command_replacements[0].lstrip()
@@ -432,6 +484,9 @@ def assemble_typer_script_content(
     else:
         parent_imports = f"from just import create_typer_app\nfrom . import {parent_cmd}_cli"
 
+    # Only the single-pass placeholder substitution needs `re`
+    extra_imports = "import re as _re\n" if "command = _re.sub(" in replacements else ""
+
     # Prepare replacements block with proper indentation
     replacements_block = ""
     if replacements:
@@ -453,11 +508,10 @@ def assemble_typer_script_content(
             repr(c.strip()) for c in custom_commands
         )
         script_content = \
-f"""import subprocess
+f"""{extra_imports}import subprocess
 import sys
-from typing import List
+from typing import Annotated, List
 
-from typing_extensions import Annotated
 import typer
 
 {parent_imports}
@@ -495,11 +549,10 @@ def main(
     if has_varargs:
         # Varargs mode: use context_settings to capture all unknown args
         script_content = \
-f"""import subprocess
+f"""{extra_imports}import subprocess
 import sys
-from typing import List
+from typing import Annotated, List
 
-from typing_extensions import Annotated
 import typer
 
 {parent_imports}
@@ -535,11 +588,10 @@ def main(
     else:
         # Standard mode
         script_content = \
-f"""import subprocess
+f"""{extra_imports}import subprocess
 import sys
-from typing import List
+from typing import Annotated, List
 
-from typing_extensions import Annotated
 import typer
 
 {parent_imports}
@@ -614,29 +666,28 @@ def generate_extension_script(
         raise FileExistsError(f"{final_expect_script_path} already exists")
 
 
-    # Remove 'just' if it's the first command
-    commands = sanitized_commands.copy()
-    if commands and commands[0] == 'just':
-        commands.pop(0)
-
+    commands = _strip_just(sanitized_commands)
     if not commands:
         raise ValueError("No command specified")
 
     # Ensure directories exist
-    ensure_command_directories_exist(sanitized_commands)
+    ensure_command_directories_exist(commands)
 
     # Generate package init files
-    generate_package_init_files(sanitized_commands)
+    generate_package_init_files(commands)
 
     # Determine command hierarchy
     just_parent_command = f"{commands[-2]}" if len(commands) > 1 else "just"
     just_sub_command = commands[-1]
 
+    # Name the parameters once; the signature and replacements share them
+    variable_names = assign_variable_names(arguments, options)
+
     # Generate function signature
-    signature = generate_function_signature(arguments, options)
+    signature = generate_function_signature(arguments, options, variable_names)
 
     # Generate command replacements
-    replacements = generate_command_replacements(arguments, options)
+    replacements = generate_command_replacements(arguments, options, variable_names)
 
     # Detect varargs
     has_varargs = any(arg.is_varargs for arg in arguments)
@@ -665,8 +716,12 @@ def generate_extension_script(
     script_path = Path(final_expect_script_path)
     script_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Encoded up front and written in binary mode: a single write(), without
+    # the text layer's newline translation
+    write_file(script_path, content.encode('utf-8'))
+
+    # Invalidate the cached module list used at CLI startup
+    touch_extensions_dir()
 
     # Return script path and command list for caller
     return script_path, commands
\ No newline at end of file
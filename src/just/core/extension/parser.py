@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Dict, Type, Tuple
 
 
@@ -10,6 +11,14 @@ TYPES = {
     'bool': bool
 }
 
+# `[annotation]` groups inside a single command token
+ANNOTATION_PATTERN = re.compile(r'\[(.+?)]')
+
+# Annotation body: var[:type][=default][#help], defaults may be quoted
+ANNOTATION_BODY_PATTERN = re.compile(
+    r'^([^:=#]+)(?::([^=#]+))?(?:=("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[^#]*))?(?:#(.*))?$'
+)
+
 
 @dataclass()
 class Argument:
@@ -154,6 +163,14 @@ def parse_command_structure(just_commands: List[str]) -> Tuple[List[str], List[A
     Returns:
         Tuple of (commands, arguments, options)
     """
+    commands, arguments, options = _parse_command_structure(tuple(just_commands))
+    # The cached result is shared between callers, so hand out fresh containers
+    return list(commands), list(arguments), dict(options)
+
+
+@lru_cache(maxsize=512)
+def _parse_command_structure(just_commands: Tuple[str, ...]) -> Tuple[List[str], List[Argument], Dict[str, Argument]]:
+    """Memoized implementation of parse_command_structure."""
     commands = []
     arguments = []
     options = {}
@@ -169,10 +186,11 @@ def parse_command_structure(just_commands: List[str]) -> Tuple[List[str], List[A
         is_flag_token = command.startswith('-') and not command[1:2].isdigit()
         
         # Try to extract annotation from this token
-        try:
-            annotation = re.findall(r'\[(.+?)]', command)[-1]
-        except IndexError:
-            annotation = ""
+        annotation = ""
+        if '[' in command:
+            annotations = ANNOTATION_PATTERN.findall(command)
+            if annotations:
+                annotation = annotations[-1]
         
         if is_flag_token:
             # If there's a pending flag without annotation, process it as self-referential first
@@ -344,9 +362,7 @@ def _process_annotation(annotation: str, identifier: str, short_flag: str, long_
             help_msg = annotation.split('#', 1)[1]
     else:
         # Parse normal annotation using regex to handle quoted values
-        # Format: var[:type][=default][#help]
-        pattern = r'^([^:=#]+)(?::([^=#]+))?(?:=("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[^#]*))?(?:#(.*))?$'
-        match = re.match(pattern, annotation)
+        match = ANNOTATION_BODY_PATTERN.match(annotation)
         
         if match:
             variable_name = match.group(1) or ""
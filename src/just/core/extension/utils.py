@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Tuple
 
@@ -13,6 +14,9 @@ TYPES = {
     'bool': bool
 }
 
+# Annotated parameters (`name[var:type#help text]`) or plain non-whitespace runs
+COMMAND_PART_PATTERN = re.compile(r'\S*\[.*?]|\S+')
+
 
 def search_existing_script(just_commands: List[str]) -> Tuple[bool, str]:
     """
@@ -139,7 +143,13 @@ def split_command_line(command_line: str) -> List[str]:
     Returns:
         List of parsed command parts
     """
+    # Callers get their own list, the cached result is shared
+    return list(_split_command_line(command_line.strip()))
+
+
+@lru_cache(maxsize=256)
+def _split_command_line(command_line: str) -> Tuple[str, ...]:
     # This regex matches annotated parameters as single units, handling nested brackets in help text
     # Pattern: \S*\[.*?\] - non-greedy match for everything in brackets
     # Or: \S+ - regular non-whitespace sequences
-    return re.findall(r'\S*\[.*?]|\S+', command_line.strip())
\ No newline at end of file
+    return tuple(COMMAND_PART_PATTERN.findall(command_line))
\ No newline at end of file
@@ -2,6 +2,11 @@ import re
 from typing import List, Tuple
 
 
+# Compiled once, sanitize_command_name runs for every part of every command
+INVALID_CHARS_PATTERN = re.compile(r'[^a-zA-Z0-9_]')
+REPEATED_UNDERSCORES_PATTERN = re.compile(r'_+')
+
+
 def sanitize_command_name(command: str) -> Tuple[str, str]:
     """
     Sanitize a command name to be a valid Python identifier and file name.
@@ -24,10 +29,10 @@ def sanitize_command_name(command: str) -> Tuple[str, str]:
     # Replace special characters with underscores
     # Allow: alphanumeric, underscore, dash (for readability in some contexts)
     # But for Python identifiers, we need to be more strict
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', command)
+    sanitized = INVALID_CHARS_PATTERN.sub('_', command)
 
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = REPEATED_UNDERSCORES_PATTERN.sub('_', sanitized)
 
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
@@ -51,7 +51,7 @@ def install_package(package_name: str, additional_args: Optional[List[str]] = No
 
         # Check if command exists before executing (follows probe_tool pattern)
         if shutil.which(cmd_name):
-            exit_code, output = execute_command(check_cmd, capture_output=True)
+            exit_code, output = execute_command(cmd_parts, capture_output=True)
             if exit_code == 0:
                 echo.success(f"{package_name} is already installed.")
                 return
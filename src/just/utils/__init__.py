@@ -1,20 +1,40 @@
-import just.utils.echo_utils as echo
-
-from just.utils.archive import extract
-from just.utils.format_utils import docstring
-from just.utils.shell_utils import execute_command, execute_commands, split_command
-from just.utils.typer_utils import create_typer_app
-from just.utils.user_interaction import confirm_action
-from just.utils.system_probe import SystemProbe
-from just.utils.download_utils import (
-    download_with_resume,
-    DownloadError,
-    NetworkError,
-    FileSystemError,
-    InvalidResponseError,
-    FileSizeMismatchError,
-    DownloadCancelledError
-)
+import importlib
+
+
+# Resolved on first access: most callers only need `echo`, and importing the
+# download/archive/prompt helpers eagerly drags in httpx, py7zr, prompt_toolkit.
+_LAZY = {
+    "echo": ("just.utils.echo_utils", None),
+    "extract": ("just.utils.archive", "extract"),
+    "docstring": ("just.utils.format_utils", "docstring"),
+    "execute_command": ("just.utils.shell_utils", "execute_command"),
+    "execute_commands": ("just.utils.shell_utils", "execute_commands"),
+    "split_command": ("just.utils.shell_utils", "split_command"),
+    "create_typer_app": ("just.utils.typer_utils", "create_typer_app"),
+    "confirm_action": ("just.utils.user_interaction", "confirm_action"),
+    "SystemProbe": ("just.utils.system_probe", "SystemProbe"),
+    "download_with_resume": ("just.utils.download_utils", "download_with_resume"),
+    "DownloadError": ("just.utils.download_utils", "DownloadError"),
+    "NetworkError": ("just.utils.download_utils", "NetworkError"),
+    "FileSystemError": ("just.utils.download_utils", "FileSystemError"),
+    "InvalidResponseError": ("just.utils.download_utils", "InvalidResponseError"),
+    "FileSizeMismatchError": ("just.utils.download_utils", "FileSizeMismatchError"),
+    "DownloadCancelledError": ("just.utils.download_utils", "DownloadCancelledError"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(globals()) + list(_LAZY)
 
 
 __all__ = [
@@ -34,4 +54,4 @@ __all__ = [
     "FileSizeMismatchError",
     "DownloadCancelledError",
     "confirm_action"
-]
\ No newline at end of file
+]
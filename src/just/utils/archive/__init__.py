@@ -1,6 +1,6 @@
 from .extractor import extract
 from .archiver import archive
-from .format_detect import ArchiveFormat, detect_archive_format, detect_format_by_extension
+from .format_detect import ArchiveFormat, detect_archive_format, detect_format_by_extension, strip_archive_extension
 from .zip_handler import extract_zip, create_zip
 from .tar_handler import extract_tar, create_tar
 from .compression_handler import (
@@ -16,6 +16,7 @@ __all__ = [
     'ArchiveFormat',
     'detect_archive_format',
     'detect_format_by_extension',
+    'strip_archive_extension',
     'extract_zip',
     'create_zip',
     'extract_tar',
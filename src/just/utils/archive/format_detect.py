@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -68,6 +69,9 @@ EXTENSION_MAP = {
     '.rar': ArchiveFormat.RAR,
 }
 
+# Longest first, so '.tar.gz' wins over '.gz'
+_EXTENSIONS = tuple(sorted(EXTENSION_MAP, key=len, reverse=True))
+
 
 def detect_format_by_magic_bytes(file_path: str) -> Optional[ArchiveFormat]:
     """
@@ -155,6 +159,17 @@ def detect_tar_zst_or_zstd(file_path: str) -> ArchiveFormat:
     return ArchiveFormat.ZSTD
 
 
+def _match_extension(file_path: str) -> Optional[str]:
+    name_lower = os.path.basename(file_path).lower()
+    # One C-level pass rejects names without any known extension
+    if not name_lower.endswith(_EXTENSIONS):
+        return None
+    for ext in _EXTENSIONS:
+        if name_lower.endswith(ext):
+            return ext
+    return None
+
+
 def detect_format_by_extension(file_path: str) -> Optional[ArchiveFormat]:
     """
     Detect archive format by file extension.
@@ -165,14 +180,25 @@ def detect_format_by_extension(file_path: str) -> Optional[ArchiveFormat]:
     Returns:
         ArchiveFormat enum or None if unknown
     """
-    path = Path(file_path)
-    name_lower = path.name.lower()
+    ext = _match_extension(file_path)
+    return EXTENSION_MAP[ext] if ext else None
+
+
+def strip_archive_extension(file_path: str) -> str:
+    """
+    Remove a known archive extension (e.g. '.tar.gz') from a path.
     
-    for ext, fmt in sorted(EXTENSION_MAP.items(), key=lambda x: -len(x[0])):
-        if name_lower.endswith(ext):
-            return fmt
+    Only the file name is inspected, so dots in parent directories
+    (such as './archive.zip') are left alone.
     
-    return None
+    Args:
+        file_path: Path to the archive file
+        
+    Returns:
+        The path without its archive extension, or unchanged if none matches
+    """
+    ext = _match_extension(file_path)
+    return file_path[:-len(ext)] if ext else file_path
 
 
 def detect_archive_format(file_path: str) -> ArchiveFormat:
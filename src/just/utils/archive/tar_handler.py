@@ -5,6 +5,11 @@ from typing import Optional
 import just.utils.echo_utils as echo
 
 
+# Read/copy size for extraction; tarfile's defaults (10 KiB stream records,
+# 16 KiB member copies) mean many small reads and writes on large archives
+EXTRACT_BUFSIZE = 1 << 20
+
+
 def extract_tar(archive_path: str, output_dir: Optional[str] = None, compression: Optional[str] = None) -> bool:
     """
     Extract a tar archive (with various compression formats).
@@ -39,14 +44,17 @@ def extract_tar(archive_path: str, output_dir: Optional[str] = None, compression
                 with open(archive_path, 'rb') as compressed:
                     dctx = zstd.ZstdDecompressor()
                     with dctx.stream_reader(compressed) as reader:
-                        with tarfile.open(fileobj=reader, mode='r|') as tar_ref:
+                        with tarfile.open(fileobj=reader, mode='r|', bufsize=EXTRACT_BUFSIZE,
+                                          copybufsize=EXTRACT_BUFSIZE) as tar_ref:
                             tar_ref.extractall(output_dir)
             except ImportError:
                 echo.error("zstandard package is required for .tar.zst files. Install with: pip install zstandard")
                 return False
         else:
-            mode = f'r:{compression}' if compression else 'r'
-            with tarfile.open(archive_path, mode) as tar_ref:
+            # Stream mode: members are read front to back without seeking
+            mode = f'r|{compression}' if compression else 'r|'
+            with tarfile.open(archive_path, mode, bufsize=EXTRACT_BUFSIZE,
+                              copybufsize=EXTRACT_BUFSIZE) as tar_ref:
                 tar_ref.extractall(output_dir)
         
         echo.info(f"Extracted {archive_path} to {output_dir}")
@@ -4,17 +4,29 @@ Download Utilities
 
 Provides file download with resume support and progress display.
 """
+from __future__ import annotations
 
-import httpx
 import os
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from urllib.parse import urlparse
 from dataclasses import dataclass
 
-from just.utils.progress import progress_bar
 import just.utils.echo_utils as echo
 
+# httpx and the progress bar are imported where they are used, so importing
+# this module (e.g. for `just download --help`) stays cheap.
+if TYPE_CHECKING:
+    import httpx
+
+
+# 1 MiB per read keeps the number of Python-level loop iterations (and
+# progress updates) per downloaded megabyte at one.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Minimum number of bytes between two progress bar updates
+PROGRESS_UPDATE_BYTES = 1 << 20
+
 
 # =============================================================================
 # Exceptions
@@ -123,6 +135,7 @@ def _remove_file(path: str, error_msg: str) -> None:
 
 def _get_size_from_head(url: str, headers: Dict[str, str], verbose: bool) -> int:
     """Get file size from HEAD request."""
+    import httpx
     if verbose:
         echo.info("Making HEAD request to check total file size")
     
@@ -137,6 +150,7 @@ def _get_size_from_head(url: str, headers: Dict[str, str], verbose: bool) -> int
 
 def _get_size_from_range(url: str, headers: Dict[str, str], verbose: bool) -> int:
     """Get file size from range request (bytes 0-0)."""
+    import httpx
     if verbose:
         echo.info("Trying range request for size")
     
@@ -169,6 +183,7 @@ def _get_size_from_range(url: str, headers: Dict[str, str], verbose: bool) -> in
 
 def _get_total_file_size(url: str, headers: Dict[str, str], verbose: bool = False) -> int:
     """Get total file size, trying HEAD first then range request."""
+    import httpx
     try:
         size = _get_size_from_head(url, headers, verbose)
         if size > 0:
@@ -202,10 +217,12 @@ def _parse_content_range(response: httpx.Response) -> int:
 
 def _check_existing_complete(output_file: str, url: str, headers: Dict[str, str], verbose: bool) -> bool:
     """Check if file already exists and is complete. Returns True if complete."""
-    if not os.path.exists(output_file):
+    # A single stat() both checks for the file and gets its size
+    try:
+        existing_size = os.stat(output_file).st_size
+    except OSError:
         return False
     
-    existing_size = os.path.getsize(output_file)
     if verbose:
         echo.info(f"Final file exists: {existing_size} bytes")
     
@@ -230,12 +247,14 @@ def _handle_temp_file(
     auto_confirm: bool
 ) -> DownloadState:
     """Handle existing temp file. Returns DownloadState for next steps."""
-    if not os.path.exists(temp_file):
+    import httpx
+    try:
+        first_byte = os.stat(temp_file).st_size
+    except OSError:
         if verbose:
             echo.info("Starting fresh download")
         return DownloadState(first_byte=0, mode="wb", total_size=0)
     
-    first_byte = os.path.getsize(temp_file)
     if verbose:
         echo.info(f"Found temp file: {first_byte} bytes")
     
@@ -258,6 +277,7 @@ def _check_compression_and_resume(
     auto_confirm: bool
 ) -> DownloadState:
     """Check compression and decide resume strategy."""
+    import httpx
     if verbose:
         echo.info("Testing server compression")
     
@@ -364,7 +384,7 @@ def _download_stream(
     total_size: int,
     mode: str,
     first_byte: int,
-    chunk_size: int = 65536,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
     verbose: bool = False
 ) -> bool:
     """Download response stream to file with progress bar."""
@@ -372,6 +392,7 @@ def _download_stream(
         echo.info(f"Downloading: total={total_size}, mode={mode}, offset={first_byte}")
     
     from rich.progress import FileSizeColumn, TransferSpeedColumn, TextColumn
+    from just.utils.progress import progress_bar
     
     progress_kwargs = {
         "total": max(0, total_size),
@@ -384,19 +405,33 @@ def _download_stream(
     bytes_written = 0
     
     try:
-        with open(output_file, mode) as f, progress_bar(**progress_kwargs) as pbar:
-            pbar.n = first_byte
-            pbar.refresh()
+        # A buffer as large as a chunk turns every chunk into a single write()
+        # instead of splitting it into 8 KiB pieces.
+        with open(output_file, mode, buffering=chunk_size) as f, progress_bar(**progress_kwargs) as pbar:
+            # Resumed bytes count as progress made; a fresh download has no
+            # need for an initial redraw.
+            if first_byte:
+                pbar.update(first_byte)
             
+            # Progress is reported once per MiB rather than once per chunk
+            pending = 0
             for i, chunk in enumerate(response.iter_bytes(chunk_size=chunk_size)):
                 if not chunk:
                     continue
                 f.write(chunk)
                 bytes_written += len(chunk)
-                pbar.update(len(chunk))
+                pending += len(chunk)
+                if pending >= PROGRESS_UPDATE_BYTES:
+                    pbar.update(pending)
+                    pending = 0
                 
-                if verbose and (i % 10 == 0 or len(chunk) < chunk_size):
+                # `verbose` short-circuits first, so a normal download pays one
+                # local lookup per chunk; verbose runs log every 16th chunk.
+                if verbose and (not i & 15 or len(chunk) < chunk_size):
                     echo.info(f"Chunk {i}: {len(chunk)}B, total: {bytes_written}B")
+            
+            if pending:
+                pbar.update(pending)
     
     except OSError as e:
         raise FileSystemError(f"Write failed: {e}") from e
@@ -429,6 +464,7 @@ def _download_fresh(
     response: httpx.Response
 ) -> bool:
     """Handle fresh download when server doesn't support Range."""
+    import httpx
     if verbose:
         echo.info(f"Server doesn't support Range, starting fresh")
     
@@ -452,7 +488,7 @@ def download_with_resume(
     url: str,
     headers: Optional[Dict[str, str]] = None,
     output_file: Optional[str] = None,
-    chunk_size: int = 65536,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
     verbose: bool = False,
     auto_confirm: bool = False
 ) -> bool:
@@ -473,6 +509,7 @@ def download_with_resume(
         InvalidResponseError: Invalid server response
         DownloadCancelledError: User cancelled
     """
+    import httpx
     headers = headers or {}
     
     # Determine output file
@@ -525,6 +562,7 @@ def _execute_download(
     verbose: bool
 ) -> bool:
     """Execute the actual download."""
+    import httpx
     if verbose:
         echo.info(f"Request headers: {headers}")
     
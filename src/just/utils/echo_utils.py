@@ -1,7 +1,5 @@
 import typer
 
-from rich.console import Console
-
 from just.utils.format_utils import docstring
 
 
@@ -62,6 +60,8 @@ def fail(*args, sep: str = ' ', end: str = '\n'):
 
 
 def markdown(*args, sep: str = ' ', end: str = '\n'):
+    from rich.console import Console
+
     text = docstring(to_string(*args, sep=sep, end=end))
     console = Console()
     # md = Markdown(text)
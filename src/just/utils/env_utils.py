@@ -44,6 +44,10 @@ class EnvConfig(ABC):
         """Initialize subclass and collect bound environment variable processors."""
         super().__init_subclass__(**kwargs)
         cls._cached_type_hints = None
+        # Attribute name -> (raw string, converted value), so an unchanged
+        # environment variable isn't parsed again on every access
+        cls._converted_values = {}
+        cls._keys_class = None
     
     def __getattribute__(self, name: str) -> Any:
         """
@@ -87,8 +91,14 @@ class EnvConfig(ABC):
         if not isinstance(env_value, str):
             return env_value
 
-        target_type = type_hints[name]
-        return self._convert_string_to_target_type(env_value, target_type)
+        cached = cls._converted_values.get(name)
+        if cached is not None and cached[0] == env_value:
+            value = cached[1]
+        else:
+            value = self._convert_string_to_target_type(env_value, type_hints[name])
+            cls._converted_values[name] = (env_value, value)
+        # Hand out copies of containers so callers can't mutate the cached value
+        return value.copy() if isinstance(value, (list, dict)) else value
 
     @staticmethod
     def _convert_string_to_target_type(string_value: str, target_type: type) -> Any:
@@ -140,14 +150,14 @@ class EnvConfig(ABC):
                 if arg_type is type(None):
                     continue
                 try:
-                    return EnvConfig.convert_string_to_target_type(string_value, arg_type)
+                    return EnvConfig._convert_string_to_target_type(string_value, arg_type)
                 except (ValueError, TypeError):
                     continue
             # If all conversions failed, raise error with all attempted types
             raise ValueError(f"Could not convert '{string_value}' to any of {type_args}")
         elif origin_type:
             # For other generic types (like List, Optional), recursively convert using origin type
-            return EnvConfig.convert_string_to_target_type(string_value, origin_type)
+            return EnvConfig._convert_string_to_target_type(string_value, origin_type)
 
         # Fallback for unsupported types - return as string with warning
         warnings.warn(f"Unsupported type: {target_type}, returning as string")
@@ -155,13 +165,17 @@ class EnvConfig(ABC):
 
     @property
     def keys(self) -> Self:
-        class EnvConfigKeys(self.__class__):
-            def __getattribute__(self, item):
-                if item.startswith('_'):
-                    return super().__getattribute__(item)
-                _ = super().__getattribute__(item)
-                return item
-        return EnvConfigKeys()
+        cls = self.__class__
+        # Built once per config class instead of on every access
+        if cls._keys_class is None:
+            class EnvConfigKeys(cls):
+                def __getattribute__(self, item):
+                    if item.startswith('_'):
+                        return super().__getattribute__(item)
+                    _ = super().__getattribute__(item)
+                    return item
+            cls._keys_class = EnvConfigKeys
+        return cls._keys_class()
 
 
 def set_proxy_env(proxy_url: str) -> dict:
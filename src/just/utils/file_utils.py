@@ -1,10 +1,35 @@
 import os
 import shutil
+import stat
 
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 from pathlib import Path
 
 
+def mtimes_are_current(mtimes: Any) -> bool:
+    """Check that every path in a recorded {path: st_mtime_ns} map still has that mtime.
+    
+    Used to validate on-disk caches built from a directory walk: adding or
+    removing an entry bumps the mtime of its directory, editing a file bumps
+    its own. A missing path or a malformed map counts as changed.
+    
+    Args:
+        mtimes: Mapping of path to the st_mtime_ns recorded for it.
+    
+    Returns:
+        True if every path still has its recorded mtime.
+    """
+    if not isinstance(mtimes, dict):
+        return False
+    for path, mtime_ns in mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
 def search_file(source_root: str, file_path: str) -> Optional[str]:
     if os.path.exists(file_path):
         return str(Path(file_path).resolve())
@@ -127,6 +152,64 @@ def mv(src: str, dst: str):
     shutil.move(src, dst)
 
 
+def fast_copy2(src: Union[str, Path], dst: Union[str, Path], *, follow_symlinks: bool = True) -> str:
+    """Copy a file with its metadata, like shutil.copy2, inside the kernel.
+    
+    Regular files are copied with os.copy_file_range, which moves the data
+    without passing it through userspace and shares extents (reflinks) on
+    copy-on-write filesystems such as Btrfs and XFS. Whatever the kernel
+    doesn't copy is finished with plain reads and writes. Platforms without
+    copy_file_range, symlinks that aren't followed, and special or empty
+    files (e.g. /proc entries that report size 0) go through shutil.copy2.
+    Can be passed as shutil.copytree's copy_function.
+    
+    Args:
+        src: Source file path.
+        dst: Destination file or directory path.
+        follow_symlinks: If False, a symlink src is copied as a symlink.
+    
+    Returns:
+        The destination file path.
+    
+    Raises:
+        shutil.SameFileError: If src and dst are the same file.
+        OSError: If copying fails.
+    
+    Examples:
+        >>> fast_copy2("/path/to/file.iso", "/backup/")
+    """
+    src, dst = os.fspath(src), os.fspath(dst)
+    if not hasattr(os, "copy_file_range") or (not follow_symlinks and os.path.islink(src)):
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    # Checked before open(): opening a FIFO for reading blocks until a writer
+    # shows up, while shutil.copy2 refuses named pipes up front
+    st = os.stat(src)
+    if not stat.S_ISREG(st.st_mode) or not st.st_size:
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    with open(src, "rb") as fsrc:
+        with open(dst, "wb") as fdst:
+            copied = 0
+            try:
+                while copied < st.st_size:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), st.st_size - copied)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError:
+                # e.g. EXDEV across filesystems on older kernels
+                pass
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
 def rm(*targets: str):
     """Remove one or more files or directories.
     
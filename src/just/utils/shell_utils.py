@@ -8,7 +8,7 @@ import just.utils.echo_utils as echo
 
 
 def execute_command(
-    command: str,
+    command: Union[str, List[str]],
     capture_output: bool = False,
     verbose: Optional[bool] = None
 ) -> Tuple[int, str]:
@@ -16,7 +16,8 @@ def execute_command(
     Execute a command in the terminal.
 
     Args:
-        command: The command to execute.
+        command: The command to execute, either a command line or an argv list.
+            An argv list is run as-is, without shlex splitting or quoting.
         capture_output: Whether to capture the output of the command. Defaults to False.
         verbose: Whether to print the command being executed and its output.
 
@@ -32,14 +33,19 @@ def execute_command(
     exit_code, output = 0, ""
 
     try:
-        command = command.strip()
+        if isinstance(command, str):
+            command = command.strip()
+            argv = shlex.split(command)
+        else:
+            argv = list(command)
+            command = shlex.join(argv)
         if verbose:
             echo.debug(" Command Execution Start ".center(terminal_width, '='))
             echo.debug(f"> {command}")
         if not capture_output:
-            res = subprocess.run(shlex.split(command))
+            res = subprocess.run(argv)
         else:
-            res = subprocess.run(shlex.split(command), capture_output=True, text=True)
+            res = subprocess.run(argv, capture_output=True, text=True)
             output = res.stdout
         exit_code = res.returncode
     except Exception as e:
@@ -4,6 +4,7 @@ import shutil
 import subprocess
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, List, Dict, Literal, Optional
 
 
@@ -11,6 +12,9 @@ Platform = Literal["linux", "darwin", "windows"]
 Arch = Literal["x86_64", "aarch64"]
 
 
+# The host doesn't change while the process runs, and installers read
+# `just.system.platform`/`.arch`/`.distro` repeatedly, so these are cached
+@lru_cache(maxsize=None)
 def get_arch() -> Arch:
     """Normalize architecture name"""
     machine = platform.machine().lower()
@@ -21,6 +25,7 @@ def get_arch() -> Arch:
     raise NotImplementedError(f"Unsupported architecture {machine}")
 
 
+@lru_cache(maxsize=None)
 def get_platform() -> Platform:
     """Normalize platform name"""
     sys_name = platform.system().lower()
@@ -29,6 +34,7 @@ def get_platform() -> Platform:
     raise NotImplementedError(f"Unsupported platform {sys_name}")
 
 
+@lru_cache(maxsize=None)
 def get_distro_name_version(plat: Platform) -> Tuple[str, str]:
     """Probe Platform, Distro, and Version"""
     plat = plat or get_platform()
@@ -81,27 +87,9 @@ def get_distro_name_version_for_windows() -> Tuple[str, str]:
     else:
         return "windows", version
 
-@dataclass
-class ToolStatus:
-    version: str = ""
-    path: Optional[str] = None
-    command: Optional[str] = None
-
-    def is_available(self) -> bool:
-        return self.command is not None
-
-
-def probe_tool(name: str) -> ToolStatus:
-    """Probe basic tools"""
-    # Check if the tool exists in the system path
-    path = shutil.which(name)
 
-    if path is None:
-        # Tool does not exist
-        return ToolStatus()
-
-    # Tool exists, try to get version information
-    version = ""
+def probe_version(name: str) -> str:
+    """Return the first line a tool prints for its version, or ''"""
     # Try common arguments to get version information
     # Different tools may use different arguments to display version
     version_args = ["--version", "-v", "version"]
@@ -117,14 +105,46 @@ def probe_tool(name: str) -> ToolStatus:
             )
             if result.returncode == 0 and result.stdout:
                 # Extract the first line of version information
-                version = result.stdout.strip().split('\n')[0]
-                break
+                return result.stdout.strip().split('\n')[0]
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
             # If one argument fails, continue trying the next
             continue
+    return ""
+
+
+@dataclass
+class ToolStatus:
+    version: Optional[str] = None
+    path: Optional[str] = None
+    command: Optional[str] = None
+
+    def get_version(self) -> str:
+        # Running the tool is far slower than finding it, and most callers
+        # only ask is_available(), so `version` stays None until asked for
+        if self.version is None:
+            self.version = probe_version(self.command) if self.command else ""
+        return self.version
+
+    def is_available(self) -> bool:
+        return self.command is not None
+
+
+@lru_cache(maxsize=None)
+def probe_tool(name: str) -> ToolStatus:
+    """Probe basic tools
+
+    Results are cached per tool name for the life of the process: every
+    `system.tools.<name>` / `system.pms.<name>` access goes through here.
+    Only the PATH lookup happens up front, see ToolStatus.get_version().
+    """
+    # Check if the tool exists in the system path
+    path = shutil.which(name)
+
+    if path is None:
+        # Tool does not exist
+        return ToolStatus()
 
-    # Return ToolStatus object
-    return ToolStatus(version=version, path=path, command=name)
+    return ToolStatus(path=path, command=name)
 
 
 
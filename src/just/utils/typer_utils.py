@@ -6,7 +6,12 @@ import typer
 from typer import Context
 from typer.core import TyperGroup
 
-from typing import Optional
+from typing import Optional, Type
+
+
+def normalize_command_name(cmd_name: str) -> str:
+    """Replace all non-alphanumeric characters with underscores."""
+    return re.sub(r'[^a-zA-Z0-9]', '_', cmd_name)
 
 
 class NormalizedGroup(TyperGroup):
@@ -23,7 +28,7 @@ class NormalizedGroup(TyperGroup):
             return cmd
 
         # If not found, try normalizing (replace all non-alphanumeric chars with underscores)
-        normalized_name = re.sub(r'[^a-zA-Z0-9]', '_', cmd_name)
+        normalized_name = normalize_command_name(cmd_name)
         if normalized_name != cmd_name:
             return super().get_command(ctx, normalized_name)
 
@@ -60,12 +65,13 @@ def detect_install_method() -> str:
 def create_typer_app(
     name: Optional[str] = None,
     help: Optional[str] = None,
+    cls: Type[TyperGroup] = NormalizedGroup,
 ) -> typer.Typer:
     typer_app = typer.Typer(
         name=name,
         help=help,
         add_completion=False,
-        cls=NormalizedGroup,  # Use custom group for command resolution
+        cls=cls,  # Use custom group for command resolution
         context_settings={
             "help_option_names": ["-h", "--help"]
         }
@@ -1,25 +1,38 @@
-from prompt_toolkit import prompt as pt_prompt
-from prompt_toolkit.styles import Style
+import sys
+from functools import lru_cache
 
 
-_prompt_style = Style.from_dict({
-    'prompt': '#00aa00 bold',
-})
+# prompt_toolkit takes >100ms to import, and most commands that can ask for
+# confirmation (rm, cp, mv) never do, so it is only imported to show a prompt
+@lru_cache(maxsize=1)
+def _prompt_style():
+    from prompt_toolkit.styles import Style
+    return Style.from_dict({
+        'prompt': '#00aa00 bold',
+    })
+
+
+def _prompt(message: str, **kwargs) -> str:
+    from prompt_toolkit import prompt as pt_prompt
+    return pt_prompt(message, style=_prompt_style(), **kwargs)
 
 
 def confirm_action(message: str) -> bool:
     """Prompt user for confirmation"""
-    response = pt_prompt(
-        f"{message} (y/N): ",
-        style=_prompt_style
-    ).strip().lower()
-    return response in ['y', 'yes']
+    message = f"{message} (y/N): "
+    if not sys.stdin.isatty():
+        # Piped or closed stdin: read the answer as a plain line (so `yes |`
+        # still works) and treat EOF as "no" instead of erroring out.
+        # The answer isn't echoed back, so the prompt line is ended up front
+        # and goes out in a single write
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+        response = sys.stdin.readline()
+    else:
+        response = _prompt(message)
+    return response.strip().lower() in ['y', 'yes']
 
 
 def get_input(message: str, default: str = "") -> str:
     """Get user input with arrow key support and better styling"""
-    return pt_prompt(
-        message,
-        default=default,
-        style=_prompt_style
-    )
\ No newline at end of file
+    return _prompt(message, default=default)
\ No newline at end of file
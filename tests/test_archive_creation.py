@@ -6,6 +6,7 @@ from just.utils.archive import (
     archive,
     extract,
     detect_format_by_extension,
+    strip_archive_extension,
     ArchiveFormat,
 )
 import just.utils.echo_utils as echo
@@ -56,6 +57,15 @@ def test_format_detection_by_output():
     assert detect_format_by_extension("out.unknown") is None
 
 
+def test_strip_archive_extension():
+    """Test that only the archive extension of the file name is removed."""
+    assert strip_archive_extension("out.tar.gz") == "out"
+    assert strip_archive_extension("./out.zip") == "./out"
+    assert strip_archive_extension("v1.2/out.TGZ") == "v1.2/out"
+    assert strip_archive_extension("out.v2.7z") == "out.v2"
+    assert strip_archive_extension("out.unknown") == "out.unknown"
+
+
 def test_zip_archive_roundtrip():
     """Test ZIP archive creation and extraction."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -314,6 +324,9 @@ if __name__ == "__main__":
         test_format_detection_by_output()
         echo.info("Format detection test passed!")
 
+        test_strip_archive_extension()
+        echo.info("Strip archive extension test passed!")
+
         test_zip_archive_roundtrip()
         echo.info("ZIP roundtrip test passed!")
 
@@ -12,6 +12,8 @@ Tests the 6 core syntax patterns:
 6. Option Alias
 """
 
+import importlib
+import inspect
 import shlex
 import shutil
 import sys
@@ -22,6 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from just.core.config import get_extension_dir
 from just.core.extension.generator import generate_extension_script
 from just.core.extension.utils import split_command_line
+from just.utils.shell_utils import execute_command
 
 
 def cleanup(name: str):
@@ -87,6 +90,42 @@ def test_pattern(name: str, original_cmd: list, extension_syntax: str, descripti
     print(f"  Result:   ✅ PASSED\n")
 
 
+def test_substitution(name: str, original_cmd: str, extension_syntax: str, args: list, expected: str):
+    """
+    Generate an extension, run it and check the command it executed.
+
+    Args:
+        name: Extension name
+        original_cmd: Original command (e.g., 'echo MESSAGE')
+        extension_syntax: Extension syntax string (e.g., 'just test MESSAGE[msg]')
+        args: Arguments passed to the extension
+        expected: Expected output of the substituted command
+    """
+    print(f"\n  Substitution: {extension_syntax} {args}")
+
+    cleanup(name)
+    try:
+        generate_extension_script(original_cmd, split_command_line(extension_syntax))
+        exit_code, output = execute_command(["just", name, *args], capture_output=True)
+        assert exit_code == 0, f"just {name} failed ({exit_code}): {output}"
+        assert output.strip() == expected, f"Expected {expected!r}, got {output.strip()!r}"
+    finally:
+        cleanup(name)
+    print(f"  Result:   ✅ {output.strip()!r}")
+
+
+def test_ext_help_table():
+    """Check the help `just ext --help` lists against the handler docstrings."""
+    from just.commands.ext import lazy_commands
+
+    print(f"\n  ext help table: {', '.join(lazy_commands)}")
+    for name, (module_name, handler, help_text) in lazy_commands.items():
+        module = importlib.import_module(f"just.commands.ext.{module_name}")
+        summary = inspect.cleandoc(getattr(module, handler).__doc__).split('\n\n')[0]
+        assert help_text == summary, f"ext {name}: help {help_text!r} != docstring {summary!r}"
+    print(f"  Result:   ✅ matches the docstrings")
+
+
 def main():
     print("\n" + "="*60)
     print("  EXTENSION SYSTEM TESTS")
@@ -153,6 +192,35 @@ def main():
         description='Pattern 6: Option Alias'
     )
     
+    # Parameters named like the generated code's own helpers
+    test_substitution(
+        name="test7",
+        original_cmd='echo A B',
+        extension_syntax='just test7 A[re] B[placeholders]',
+        args=['x', 'y'],
+        expected='x y'
+    )
+
+    # A substituted value is not rescanned for other placeholders
+    test_substitution(
+        name="test8",
+        original_cmd='echo SRC DEST',
+        extension_syntax='just test8 SRC[src] DEST[dest]',
+        args=['DEST', 'b'],
+        expected='DEST b'
+    )
+
+    # A value containing a flag identifier survives the flag's removal
+    test_substitution(
+        name="test9",
+        original_cmd='echo --quiet MSG',
+        extension_syntax='just test9 --quiet[-q:bool=false] -m/--message MSG[msg]',
+        args=['-m', 'a --quiet b'],
+        expected='a --quiet b'
+    )
+
+    test_ext_help_table()
+
     print("\n" + "="*60)
     print("  ALL 6 PATTERNS PASSED!")
     print("="*60 + "\n")
@@ -3,6 +3,7 @@
 Test script for file_utils module functionality.
 """
 
+import shutil
 import sys
 import tempfile
 import os
@@ -11,7 +12,7 @@ from pathlib import Path
 # Add the src directory to the path so we can import just modules
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from just.utils.file_utils import mkdir, mv, rm, write_file, symlink
+from just.utils.file_utils import fast_copy2, mkdir, mv, rm, write_file, symlink
 
 
 def can_create_symlinks():
@@ -152,6 +153,42 @@ def test_mv_to_directory():
     print("✅ mv file into directory test passed")
 
 
+def test_fast_copy2():
+    """Test copying a file's content and metadata, into a file or a directory."""
+    print("Testing fast_copy2...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        src_file = Path(temp_dir) / "src.bin"
+        content = os.urandom(300_000)
+        src_file.write_bytes(content)
+        os.chmod(src_file, 0o751)
+        os.utime(src_file, (1_000_000_000, 1_000_000_000))
+        dst_dir = Path(temp_dir) / "dst"
+        dst_dir.mkdir()
+        
+        # Copy to a file path, then into a directory
+        fast_copy2(str(src_file), str(Path(temp_dir) / "copy.bin"))
+        fast_copy2(str(src_file), str(dst_dir))
+        
+        for copied in (Path(temp_dir) / "copy.bin", dst_dir / "src.bin"):
+            assert copied.read_bytes() == content
+            assert copied.stat().st_mtime == src_file.stat().st_mtime
+            if os.name != "nt":
+                assert copied.stat().st_mode == src_file.stat().st_mode
+        
+        # A named pipe is refused like shutil.copy2 does, instead of blocking on open()
+        if hasattr(os, "mkfifo"):
+            fifo = Path(temp_dir) / "pipe"
+            os.mkfifo(fifo)
+            try:
+                fast_copy2(str(fifo), str(Path(temp_dir) / "pipe_copy"))
+                assert False, "copying a named pipe should fail"
+            except shutil.SpecialFileError:
+                pass
+    
+    print("✅ fast_copy2 test passed")
+
+
 def test_rm_single_file():
     """Test removing a single file."""
     print("Testing rm with single file...")
@@ -329,6 +366,7 @@ def run_all_tests():
         test_mv_file,
         test_mv_directory,
         test_mv_to_directory,
+        test_fast_copy2,
         test_rm_single_file,
         test_rm_single_directory,
         test_rm_multiple_targets,
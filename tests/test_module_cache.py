@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for the command module cache used at CLI startup.
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from just.utils.shell_utils import execute_command
+
+
+PACKAGE_INIT = '''from just import just_cli, create_typer_app
+
+
+mytool_cli = create_typer_app(name="mytool", help="My tool.")
+just_cli.add_typer(mytool_cli)
+'''
+
+COMMAND_SCRIPT = '''from . import mytool_cli
+
+
+@mytool_cli.command(name="{name}")
+def main():
+    """{help}"""
+    print("{name} ran")
+'''
+
+
+def setup_test_home():
+    """Create a temporary home with an extension package holding one command."""
+    home = Path(tempfile.mkdtemp(prefix="test_module_cache_home_"))
+    package_dir = home / ".just" / "extensions" / "mytool"
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text(PACKAGE_INIT, encoding="utf-8")
+    (package_dir / "hello.py").write_text(
+        COMMAND_SCRIPT.format(name="hello", help="Say hello."), encoding="utf-8"
+    )
+    print(f"Created test home: {home}")
+    return home
+
+
+def run_just(home, *args):
+    """Run just with the given home directory, return (exit_code, output)."""
+    env_overrides = {"HOME": str(home), "USERPROFILE": str(home)}
+    saved = {key: os.environ.get(key) for key in env_overrides}
+    os.environ.update(env_overrides)
+    try:
+        return execute_command(["just", *args], capture_output=True)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def test_nested_script_invalidates_cache(home):
+    """A script added inside an existing extension package is picked up on a warm cache."""
+    print("\n=== Testing nested script invalidation ===")
+
+    # Builds the cache, then hits it
+    for _ in range(2):
+        exit_code, output = run_just(home, "mytool", "hello")
+        assert exit_code == 0, f"mytool hello failed with exit code {exit_code}: {output}"
+        assert "hello ran" in output
+    assert (home / ".just" / "cache" / "commands.json").exists(), "module cache was not written"
+
+    # Neither the extensions root nor the commands dir changes here
+    (home / ".just" / "extensions" / "mytool" / "logs.py").write_text(
+        COMMAND_SCRIPT.format(name="logs", help="Show logs."), encoding="utf-8"
+    )
+    exit_code, output = run_just(home, "mytool", "logs")
+    assert exit_code == 0, f"mytool logs failed with exit code {exit_code}: {output}"
+    assert "logs ran" in output
+    print("✅ Nested script is found after the cache was built")
+
+
+def test_edited_help_invalidates_cache(home):
+    """`just --help` shows a command's help text as edited, not as cached."""
+    print("\n=== Testing edited help text ===")
+
+    exit_code, output = run_just(home, "--help")
+    assert exit_code == 0, f"--help failed with exit code {exit_code}: {output}"
+    assert "My tool." in output
+
+    init_file = home / ".just" / "extensions" / "mytool" / "__init__.py"
+    init_file.write_text(PACKAGE_INIT.replace("My tool.", "My edited tool."), encoding="utf-8")
+    exit_code, output = run_just(home, "--help")
+    assert exit_code == 0, f"--help failed with exit code {exit_code}: {output}"
+    assert "My edited tool." in output, "--help still shows the cached help text"
+    print("✅ Edited help text is shown after the cache was built")
+
+
+def test_nested_script_in_extension_list(home):
+    """`just ext list` counts a script added inside a package after its index was cached."""
+    print("\n=== Testing extension index invalidation ===")
+
+    def listed_total():
+        exit_code, output = run_just(home, "ext", "list")
+        assert exit_code == 0, f"ext list failed with exit code {exit_code}: {output}"
+        match = re.search(r"Total: (\d+)", output)
+        assert match, f"ext list printed no total: {output}"
+        return int(match.group(1))
+
+    # Builds the index, then hits it
+    listed_total()
+    total = listed_total()
+
+    (home / ".just" / "extensions" / "mytool" / "status.py").write_text(
+        COMMAND_SCRIPT.format(name="status", help="Show status."), encoding="utf-8"
+    )
+    assert listed_total() == total + 1, "ext list still reports the cached total"
+    print("✅ Nested script is listed after the index was cached")
+
+
+def cleanup_test_home(home):
+    """Clean up the temporary home."""
+    shutil.rmtree(home)
+    print(f"Cleaned up test home: {home}")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("Running module cache tests...\n")
+
+    tests = [
+        test_nested_script_invalidates_cache,
+        test_edited_help_invalidates_cache,
+        test_nested_script_in_extension_list,
+    ]
+
+    passed = 0
+    failed = 0
+
+    home = setup_test_home()
+    try:
+        for test in tests:
+            try:
+                test(home)
+                passed += 1
+            except Exception as e:
+                print(f"❌ Test {test.__name__} failed with exception: {e}")
+                import traceback
+                traceback.print_exc()
+                failed += 1
+    finally:
+        cleanup_test_home(home)
+
+    print(f"\nResults: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)